@@ -3,23 +3,30 @@ Script to create sample data files for testing the ETL pipeline.
 This will generate realistic sample Excel and CSV files with various data types.
 """
 
+import shutil
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
 from pathlib import Path
 
-# Set random seed for reproducible results
-np.random.seed(42)
-random.seed(42)
+# Shared random generator for reproducible results
+rng = np.random.default_rng(42)
+
+# xlsxwriter writes new workbooks faster than openpyxl. constant_memory mode is
+# not used: pandas writes cell by cell across rows, and that mode silently drops
+# any cell in a row it has already flushed.
+EXCEL_WRITE_OPTIONS = {
+    'index': False,
+    'engine': 'xlsxwriter'
+}
 
 def create_sales_data(num_records=1000):
     """Create sample sales data."""
     
-    # Generate date range
-    start_date = datetime(2023, 1, 1)
-    end_date = datetime(2024, 1, 31)
-    date_range = pd.date_range(start_date, end_date, freq='D')
+    # Date range, sampled as whole-day offsets from the start date
+    start_date = np.datetime64('2023-01-01')
+    end_date = np.datetime64('2024-01-31')
+    num_days = int((end_date - start_date) / np.timedelta64(1, 'D')) + 1
     
     # Product categories and names
     categories = ['Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports', 'Toys']
@@ -37,36 +44,37 @@ def create_sales_data(num_records=1000):
     sales_reps = ['Alice Johnson', 'Bob Smith', 'Carol Davis', 'David Wilson', 'Eva Brown', 
                   'Frank Miller', 'Grace Lee', 'Henry Taylor', 'Ivy Chen', 'Jack Anderson']
     
-    # Generate sample data
-    data = []
-    for _ in range(num_records):
-        category = random.choice(categories)
-        product = random.choice(products[category])
-        
-        # Generate realistic sales data
-        base_price = random.uniform(10, 500)
-        quantity = random.randint(1, 20)
-        discount = random.uniform(0, 0.3)  # 0-30% discount
-        
-        unit_price = base_price * (1 - discount)
-        total_amount = unit_price * quantity
-        
-        record = {
-            'Date': random.choice(date_range.tolist()),
-            'Product_Category': category,
-            'Product_Name': product,
-            'Quantity': quantity,
-            'Unit_Price': round(unit_price, 2),
-            'Total_Amount': round(total_amount, 2),
-            'Discount_Percent': round(discount * 100, 1),
-            'Sales_Rep': random.choice(sales_reps),
-            'Region': random.choice(regions),
-            'Customer_Type': random.choice(['Individual', 'Business', 'Government']),
-            'Payment_Method': random.choice(['Credit Card', 'Cash', 'Bank Transfer', 'Check'])
-        }
-        data.append(record)
-    
-    return pd.DataFrame(data)
+    # Pick a category per record, then a product within that category by
+    # indexing into a flattened product list with per-category offsets
+    category_idx = rng.integers(0, len(categories), num_records)
+    product_counts = np.array([len(products[c]) for c in categories])
+    product_offsets = np.concatenate(([0], np.cumsum(product_counts)[:-1]))
+    flat_products = np.array([p for c in categories for p in products[c]])
+    product_idx = product_offsets[category_idx] + (
+        rng.random(num_records) * product_counts[category_idx]
+    ).astype(int)
+    
+    # Generate realistic sales data
+    base_price = rng.uniform(10, 500, num_records)
+    quantity = rng.integers(1, 21, num_records)
+    discount = rng.uniform(0, 0.3, num_records)  # 0-30% discount
+    
+    unit_price = base_price * (1 - discount)
+    total_amount = unit_price * quantity
+    
+    return pd.DataFrame({
+        'Date': start_date + rng.integers(0, num_days, num_records).astype('timedelta64[D]'),
+        'Product_Category': np.array(categories)[category_idx],
+        'Product_Name': flat_products[product_idx],
+        'Quantity': quantity,
+        'Unit_Price': np.round(unit_price, 2),
+        'Total_Amount': np.round(total_amount, 2),
+        'Discount_Percent': np.round(discount * 100, 1),
+        'Sales_Rep': rng.choice(sales_reps, num_records),
+        'Region': rng.choice(regions, num_records),
+        'Customer_Type': rng.choice(['Individual', 'Business', 'Government'], num_records),
+        'Payment_Method': rng.choice(['Credit Card', 'Cash', 'Bank Transfer', 'Check'], num_records)
+    })
 
 def create_customer_data(num_records=500):
     """Create sample customer data."""
@@ -82,31 +90,34 @@ def create_customer_data(num_records=500):
     
     states = ['NY', 'CA', 'IL', 'TX', 'AZ', 'PA', 'FL']
     
-    data = []
-    for i in range(num_records):
-        customer_id = f"CUST_{i+1:05d}"
-        first_name = random.choice(first_names)
-        last_name = random.choice(last_names)
-        
-        record = {
-            'Customer_ID': customer_id,
-            'First_Name': first_name,
-            'Last_Name': last_name,
-            'Email': f"{first_name.lower()}.{last_name.lower()}@email.com",
-            'Phone': f"({random.randint(200,999)}) {random.randint(200,999)}-{random.randint(1000,9999)}",
-            'City': random.choice(cities),
-            'State': random.choice(states),
-            'ZIP_Code': f"{random.randint(10000, 99999)}",
-            'Age': random.randint(18, 80),
-            'Gender': random.choice(['Male', 'Female', 'Other']),
-            'Registration_Date': datetime(2020, 1, 1) + timedelta(days=random.randint(0, 1460)),
-            'Total_Purchases': random.randint(1, 50),
-            'Total_Spent': round(random.uniform(50, 5000), 2),
-            'Loyalty_Status': random.choice(['Bronze', 'Silver', 'Gold', 'Platinum'])
-        }
-        data.append(record)
-    
-    return pd.DataFrame(data)
+    # Draw name indices once so the lowercase email parts come from the short name lists
+    first_idx = rng.integers(0, len(first_names), num_records)
+    last_idx = rng.integers(0, len(last_names), num_records)
+    first_name = np.array(first_names)[first_idx]
+    last_name = np.array(last_names)[last_idx]
+    email_first = np.char.lower(np.array(first_names))[first_idx]
+    email_last = np.char.lower(np.array(last_names))[last_idx]
+    
+    area_code, exchange, line = (rng.integers(low, high + 1, num_records).astype(str)
+                                 for low, high in [(200, 999), (200, 999), (1000, 9999)])
+    
+    return pd.DataFrame({
+        'Customer_ID': np.char.add('CUST_', np.char.zfill(np.arange(1, num_records + 1).astype(str), 5)),
+        'First_Name': first_name,
+        'Last_Name': last_name,
+        'Email': np.char.add(np.char.add(email_first, '.'), np.char.add(email_last, '@email.com')),
+        'Phone': np.char.add(np.char.add(np.char.add('(', area_code), np.char.add(') ', exchange)),
+                             np.char.add('-', line)),
+        'City': rng.choice(cities, num_records),
+        'State': rng.choice(states, num_records),
+        'ZIP_Code': rng.integers(10000, 100000, num_records).astype(str),
+        'Age': rng.integers(18, 81, num_records),
+        'Gender': rng.choice(['Male', 'Female', 'Other'], num_records),
+        'Registration_Date': np.datetime64('2020-01-01') + rng.integers(0, 1461, num_records).astype('timedelta64[D]'),
+        'Total_Purchases': rng.integers(1, 51, num_records),
+        'Total_Spent': np.round(rng.uniform(50, 5000, num_records), 2),
+        'Loyalty_Status': rng.choice(['Bronze', 'Silver', 'Gold', 'Platinum'], num_records)
+    })
 
 def create_inventory_data(num_records=200):
     """Create sample inventory data."""
@@ -116,32 +127,33 @@ def create_inventory_data(num_records=200):
     suppliers = ['Supplier A', 'Supplier B', 'Supplier C', 'Supplier D', 'Supplier E']
     warehouses = ['Warehouse North', 'Warehouse South', 'Warehouse East', 'Warehouse West']
     
-    data = []
-    for i in range(num_records):
-        product_id = f"PROD_{i+1:05d}"
-        category = random.choice(categories)
-        
-        # Generate realistic inventory data
-        cost_price = random.uniform(5, 200)
-        selling_price = cost_price * random.uniform(1.2, 3.0)  # 20-200% markup
-        
-        record = {
-            'Product_ID': product_id,
-            'Product_Name': f"{category} Item {i+1}",
-            'Category': category,
-            'Supplier': random.choice(suppliers),
-            'Warehouse': random.choice(warehouses),
-            'Cost_Price': round(cost_price, 2),
-            'Selling_Price': round(selling_price, 2),
-            'Stock_Quantity': random.randint(0, 1000),
-            'Reorder_Level': random.randint(10, 100),
-            'Last_Restocked': datetime.now() - timedelta(days=random.randint(1, 90)),
-            'Expiry_Date': datetime.now() + timedelta(days=random.randint(30, 730)) if random.random() > 0.7 else None,
-            'Status': random.choice(['Active', 'Discontinued', 'Out of Stock'])
-        }
-        data.append(record)
-    
-    return pd.DataFrame(data)
+    record_numbers = np.arange(1, num_records + 1).astype(str)
+    category = rng.choice(categories, num_records)
+    
+    # Generate realistic inventory data
+    cost_price = rng.uniform(5, 200, num_records)
+    selling_price = cost_price * rng.uniform(1.2, 3.0, num_records)  # 20-200% markup
+    
+    # Roughly 30% of products are perishable and get an expiry date
+    now = np.datetime64(datetime.now())
+    has_expiry = rng.random(num_records) > 0.7
+    expiry_days = rng.integers(30, 731, num_records).astype('timedelta64[D]')
+    expiry_date = np.where(has_expiry, now + expiry_days, np.datetime64('NaT'))
+    
+    return pd.DataFrame({
+        'Product_ID': np.char.add('PROD_', np.char.zfill(record_numbers, 5)),
+        'Product_Name': np.char.add(np.char.add(category, ' Item '), record_numbers),
+        'Category': category,
+        'Supplier': rng.choice(suppliers, num_records),
+        'Warehouse': rng.choice(warehouses, num_records),
+        'Cost_Price': np.round(cost_price, 2),
+        'Selling_Price': np.round(selling_price, 2),
+        'Stock_Quantity': rng.integers(0, 1001, num_records),
+        'Reorder_Level': rng.integers(10, 101, num_records),
+        'Last_Restocked': now - rng.integers(1, 91, num_records).astype('timedelta64[D]'),
+        'Expiry_Date': expiry_date,
+        'Status': rng.choice(['Active', 'Discontinued', 'Out of Stock'], num_records)
+    })
 
 def create_financial_data(num_records=300):
     """Create sample financial data."""
@@ -151,37 +163,61 @@ def create_financial_data(num_records=300):
     expense_categories = ['Marketing', 'Operations', 'Salaries', 'Rent', 'Utilities', 'Travel', 'Equipment']
     revenue_categories = ['Product Sales', 'Service Revenue', 'Interest Income', 'Other Income']
     
-    data = []
-    for i in range(num_records):
-        account_type = random.choice(account_types)
-        
-        if account_type == 'Expense':
-            category = random.choice(expense_categories)
-            amount = -random.uniform(100, 10000)  # Negative for expenses
-        elif account_type == 'Revenue':
-            category = random.choice(revenue_categories)
-            amount = random.uniform(500, 50000)  # Positive for revenue
-        else:
-            category = account_type
-            amount = random.uniform(-20000, 20000)
-        
-        record = {
-            'Transaction_ID': f"TXN_{i+1:06d}",
-            'Date': datetime(2023, 1, 1) + timedelta(days=random.randint(0, 395)),
-            'Account_Type': account_type,
-            'Category': category,
-            'Description': f"{category} transaction {i+1}",
-            'Amount': round(amount, 2),
-            'Reference': f"REF_{random.randint(1000, 9999)}",
-            'Department': random.choice(['Sales', 'Marketing', 'Operations', 'HR', 'Finance', 'IT']),
-            'Approved_By': random.choice(['Manager A', 'Manager B', 'Manager C', 'CFO', 'CEO'])
-        }
-        data.append(record)
-    
-    return pd.DataFrame(data)
+    record_numbers = np.arange(1, num_records + 1).astype(str)
+    type_idx = rng.integers(0, len(account_types), num_records)
+    account_type = np.take(account_types, type_idx)
+    is_revenue = type_idx == account_types.index('Revenue')
+    is_expense = type_idx == account_types.index('Expense')
+    
+    # Balance sheet accounts use the account type as their category
+    category = np.select(
+        [is_expense, is_revenue],
+        [rng.choice(expense_categories, num_records), rng.choice(revenue_categories, num_records)],
+        default=account_type
+    )
+    amount = np.select(
+        [is_expense, is_revenue],
+        [-rng.uniform(100, 10000, num_records),  # Negative for expenses
+         rng.uniform(500, 50000, num_records)],  # Positive for revenue
+        default=rng.uniform(-20000, 20000, num_records)
+    )
+    
+    return pd.DataFrame({
+        'Transaction_ID': np.char.add('TXN_', np.char.zfill(record_numbers, 6)),
+        'Date': np.datetime64('2023-01-01') + rng.integers(0, 396, num_records).astype('timedelta64[D]'),
+        'Account_Type': account_type,
+        'Category': category,
+        'Description': np.char.add(np.char.add(category, ' transaction '), record_numbers),
+        'Amount': np.round(amount, 2),
+        'Reference': np.char.add('REF_', rng.integers(1000, 10000, num_records).astype(str)),
+        'Department': rng.choice(['Sales', 'Marketing', 'Operations', 'HR', 'Finance', 'IT'], num_records),
+        'Approved_By': rng.choice(['Manager A', 'Manager B', 'Manager C', 'CFO', 'CEO'], num_records)
+    })
+
+def save_dataset(df, output_dir, sample_format, excel_name=None, csv_name=None):
+    """Save a sample dataset in the requested sample format.
+    
+    The 'excel_csv' format writes the given Excel and/or CSV files. The
+    'feather' format writes a single LZ4-compressed Arrow IPC file instead,
+    named after the Excel file (or the CSV file if there is none).
+    """
+    if sample_format == 'feather':
+        feather_name = Path(excel_name or csv_name).with_suffix('.feather')
+        df.to_feather(output_dir / feather_name, compression='lz4')
+        return
+    
+    if excel_name:
+        df.to_excel(output_dir / excel_name, **EXCEL_WRITE_OPTIONS)
+    if csv_name:
+        df.to_csv(output_dir / csv_name, index=False)
 
-def main():
-    """Generate all sample data files."""
+def main(sample_format='excel_csv'):
+    """Generate all sample data files.
+    
+    Args:
+        sample_format (str): 'excel_csv' for the xlsx and csv files, or 'feather'
+                             to write each dataset once as a Feather file
+    """
     
     # Create output directory
     output_dir = Path("data/input")
@@ -194,33 +230,37 @@ def main():
     sales_df = create_sales_data(1000)
     
     # Save as both Excel and CSV
-    sales_df.to_excel(output_dir / "sales_data_2023.xlsx", index=False)
-    sales_df.to_csv(output_dir / "sales_data_2023.csv", index=False)
+    save_dataset(sales_df, output_dir, sample_format, "sales_data_2023.xlsx", "sales_data_2023.csv")
     
-    # Create additional sales files with different date ranges
-    sales_q1 = sales_df[sales_df['Date'] <= '2023-03-31']
-    sales_q1.to_excel(output_dir / "sales_q1_2023.xlsx", index=False)
-    
-    sales_q2 = sales_df[(sales_df['Date'] > '2023-03-31') & (sales_df['Date'] <= '2023-06-30')]
-    sales_q2.to_csv(output_dir / "sales_q2_2023.csv", index=False)
+    # Write the sales data once as a quarter-partitioned Parquet dataset instead of
+    # regenerating separate per-quarter files; a single quarter is read with a
+    # partition filter. The checked-in sales_q1_2023.xlsx / sales_q2_2023.csv
+    # fixtures stay as they are. pyarrow adds new uniquely named files on every
+    # write, so the previous dataset is removed first.
+    sales_quarter = sales_df['Date'].dt.to_period('Q').astype(str)
+    dataset_dir = output_dir / "sales_by_quarter"
+    try:
+        shutil.rmtree(dataset_dir, ignore_errors=True)
+        sales_df.assign(quarter=sales_quarter).to_parquet(
+            dataset_dir, partition_cols=['quarter'], compression='snappy'
+        )
+    except ImportError:
+        print("pyarrow is not installed; skipping the partitioned Parquet sales dataset")
     
     # Generate customer data
     print("Creating customer data...")
     customer_df = create_customer_data(500)
-    customer_df.to_excel(output_dir / "customer_database.xlsx", index=False)
-    customer_df.to_csv(output_dir / "customer_export.csv", index=False)
+    save_dataset(customer_df, output_dir, sample_format, "customer_database.xlsx", "customer_export.csv")
     
     # Generate inventory data
     print("Creating inventory data...")
     inventory_df = create_inventory_data(200)
-    inventory_df.to_excel(output_dir / "inventory_report.xlsx", index=False)
-    inventory_df.to_csv(output_dir / "current_inventory.csv", index=False)
+    save_dataset(inventory_df, output_dir, sample_format, "inventory_report.xlsx", "current_inventory.csv")
     
     # Generate financial data
     print("Creating financial data...")
     financial_df = create_financial_data(300)
-    financial_df.to_excel(output_dir / "financial_transactions.xlsx", index=False)
-    financial_df.to_csv(output_dir / "accounting_data.csv", index=False)
+    save_dataset(financial_df, output_dir, sample_format, "financial_transactions.xlsx", "accounting_data.csv")
     
     # Create some files with missing data and duplicates for testing data cleaning
     print("Creating test files with data quality issues...")
@@ -229,26 +269,35 @@ def main():
     sales_with_missing = sales_df.copy()
     # Randomly set some values to NaN
     for col in ['Unit_Price', 'Sales_Rep', 'Region']:
-        mask = np.random.random(len(sales_with_missing)) < 0.1  # 10% missing
+        mask = rng.random(len(sales_with_missing)) < 0.1  # 10% missing
         sales_with_missing.loc[mask, col] = np.nan
     
-    sales_with_missing.to_excel(output_dir / "sales_with_missing_data.xlsx", index=False)
+    save_dataset(sales_with_missing, output_dir, sample_format, excel_name="sales_with_missing_data.xlsx")
     
     # Customer data with duplicates
     customer_with_dupes = customer_df.copy()
     # Add some duplicate rows
-    duplicates = customer_df.sample(n=50)
+    duplicates = customer_df.sample(n=50, random_state=rng)
     customer_with_dupes = pd.concat([customer_with_dupes, duplicates], ignore_index=True)
-    customer_with_dupes.to_csv(output_dir / "customer_with_duplicates.csv", index=False)
+    save_dataset(customer_with_dupes, output_dir, sample_format, csv_name="customer_with_duplicates.csv")
     
     print(f"\nSample data files created in {output_dir}:")
     for file in output_dir.glob("*"):
         if file.is_file():
             print(f"  - {file.name}")
     
-    print(f"\nTotal files created: {len(list(output_dir.glob('*')))}")
+    print(f"\nTotal files created: {sum(1 for file in output_dir.glob('*') if file.is_file())}")
     print("Sample data generation completed!")
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Generate sample input files for the ETL pipeline')
+    parser.add_argument(
+        '--sample-format',
+        choices=['excel_csv', 'feather'],
+        default='excel_csv',
+        help='Write xlsx/csv files (default) or a single Feather file per dataset'
+    )
+    main(parser.parse_args().sample_format)
 
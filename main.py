@@ -25,6 +25,7 @@ Examples:
   python main.py -i data/input -o data/output      # Specify directories
   python main.py -c config.json                    # Use configuration file
   python main.py --generate-sample-data            # Generate sample data first
+  python main.py --generate-sample-data --sample-format feather  # Sample data as Feather files
         """
     )
     
@@ -51,6 +52,13 @@ Examples:
         help='Generate sample data files for testing'
     )
     
+    parser.add_argument(
+        '--sample-format',
+        choices=['excel_csv', 'feather'],
+        default='excel_csv',
+        help='File format for --generate-sample-data: xlsx/csv files, or one Feather file per dataset (default: excel_csv)'
+    )
+    
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -61,9 +69,10 @@ Examples:
     parser.add_argument(
         '--formats',
         nargs='+',
-        choices=['csv', 'excel', 'excel_styled', 'summary'],
-        default=['csv', 'excel_styled', 'summary'],
-        help='Output formats to generate'
+        choices=['csv', 'excel', 'excel_styled', 'summary', 'feather', 'parquet'],
+        default=None,
+        help='Output formats to generate (default: the config file\'s formats, '
+             'otherwise parquet (csv without pyarrow), excel_styled and summary)'
     )
     
     args = parser.parse_args()
@@ -73,7 +82,7 @@ Examples:
         print("Generating sample data...")
         try:
             import create_sample_data
-            create_sample_data.main()
+            create_sample_data.main(args.sample_format)
             print("Sample data generated successfully!")
         except Exception as e:
             print(f"Error generating sample data: {e}")
@@ -87,7 +96,7 @@ Examples:
         return 1
     
     # Count input files
-    file_patterns = ['*.xlsx', '*.xls', '*.csv']
+    file_patterns = ['*.xlsx', '*.xls', '*.csv', '*.parquet', '*.feather']
     input_files = []
     for pattern in file_patterns:
         input_files.extend(list(input_path.glob(pattern)))
@@ -109,10 +118,10 @@ Examples:
             log_level=args.log_level
         )
         
-        # Configure loading options
-        loading_config = {
-            'formats': args.formats
-        }
+        # Configure loading options; without --formats the config decides
+        loading_config = {}
+        if args.formats:
+            loading_config['formats'] = args.formats
         
         print("Starting ETL pipeline execution...")
         results = generator.run_complete_pipeline(loading=loading_config)
@@ -8,11 +8,42 @@ and combine them into a unified dataset.
 
 import os
 import glob
+import codecs
+import fnmatch
+import importlib.util
 import pandas as pd
+import numpy as np
 import logging
-from typing import List, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Dict, Optional, Union
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional; fall back to pandas-only code paths
+    pa = None
+    pacsv = None
+    pq = None
+
+try:
+    from charset_normalizer import from_bytes as detect_charset
+except ImportError:  # charset-normalizer is optional; only UTF-8 is sniffed without it
+    detect_charset = None
+
+# python-calamine gives pandas (>= 2.2) a Rust-based reader for both .xlsx and .xls
+CALAMINE_AVAILABLE = importlib.util.find_spec('python_calamine') is not None
+
+# Encodings tried, in order, when a CSV file cannot be decoded
+FALLBACK_ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+
+# Text columns with few distinct values that are stored as pandas categoricals
+DEFAULT_LOW_CARDINALITY_COLUMNS = [
+    'Product_Category', 'Region', 'Sales_Rep', 'Payment_Method', 'Customer_Type',
+    'Loyalty_Status', 'State', 'Gender', 'Status'
+]
+
 
 class DataExtractor:
     """
@@ -28,7 +59,17 @@ class DataExtractor:
             log_level (str): Logging level (DEBUG, INFO, WARNING, ERROR)
         """
         self.input_directory = Path(input_directory)
-        self.supported_formats = ['.xlsx', '.xls', '.csv']
+        self.supported_formats = ['.xlsx', '.xls', '.csv', '.parquet', '.feather']
+        
+        # Non-UTF-8 encodings that decoded successfully, keyed by directory.
+        # Files from the same producer usually share an encoding.
+        self._encoding_cache: Dict[Path, str] = {}
+        
+        # Number of files found by the most recent extract_data call
+        self.last_file_count = 0
+        
+        # File names in the input directory, keyed by the directory's mtime and size
+        self._listing_cache: Optional[tuple] = None
         
         # Set up logging
         logging.basicConfig(
@@ -56,10 +97,18 @@ class DataExtractor:
         
         if file_patterns is None:
             # Default patterns for all supported formats
-            file_patterns = ['*.xlsx', '*.xls', '*.csv']
+            file_patterns = ['*.xlsx', '*.xls', '*.csv', '*.parquet', '*.feather']
         
+        file_names = None
         for pattern in file_patterns:
-            files = list(self.input_directory.glob(pattern))
+            if '/' in pattern or '**' in pattern:
+                files = list(self.input_directory.glob(pattern))
+            else:
+                # Plain name patterns are matched against one cached directory listing
+                if file_names is None:
+                    file_names = self._list_file_names()
+                files = [self.input_directory / name
+                         for name in fnmatch.filter(file_names, pattern)]
             discovered_files.extend(files)
             self.logger.info(f"Found {len(files)} files matching pattern '{pattern}'")
         
@@ -69,6 +118,25 @@ class DataExtractor:
         
         return discovered_files
     
+    def _list_file_names(self) -> List[str]:
+        """
+        List the names of the regular files in the input directory.
+        
+        The listing comes from a single os.scandir pass and is reused until the
+        directory's mtime or size changes, i.e. until files are added, removed
+        or renamed.
+        
+        Returns:
+            List[str]: File names in the input directory
+        """
+        dir_stat = self.input_directory.stat()
+        key = (dir_stat.st_mtime_ns, dir_stat.st_size)
+        if self._listing_cache is None or self._listing_cache[0] != key:
+            with os.scandir(self.input_directory) as entries:
+                names = [entry.name for entry in entries if entry.is_file()]
+            self._listing_cache = (key, names)
+        return self._listing_cache[1]
+    
     def read_excel_file(self, file_path: Path, **kwargs) -> pd.DataFrame:
         """
         Read an Excel file and return a DataFrame.
@@ -79,13 +147,16 @@ class DataExtractor:
         
         Returns:
             pd.DataFrame: Data from the Excel file
+        
+        The calamine engine is used when python-calamine is installed,
+        otherwise openpyxl.
         """
         try:
             # Default parameters for Excel reading
             excel_params = {
                 'sheet_name': 0,  # Read first sheet by default
                 'header': 0,      # First row as header
-                'engine': 'openpyxl'
+                'engine': 'calamine' if CALAMINE_AVAILABLE else 'openpyxl'
             }
             excel_params.update(kwargs)
             
@@ -107,6 +178,9 @@ class DataExtractor:
         
         Returns:
             pd.DataFrame: Data from the CSV file
+        
+        When pyarrow is installed and no reader arguments are given, the file
+        is parsed with pyarrow's multithreaded CSV reader instead of pandas.
         """
         try:
             # Default parameters for CSV reading
@@ -117,28 +191,119 @@ class DataExtractor:
             }
             csv_params.update(kwargs)
             
-            # Try different encodings if utf-8 fails
-            encodings_to_try = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+            # Try the detected (or requested) encoding first, then fall back to common ones
+            preferred_encoding = kwargs.get('encoding') or self._detect_encoding(file_path)
+            encodings_to_try = list(dict.fromkeys([preferred_encoding] + FALLBACK_ENCODINGS))
             
             for encoding in encodings_to_try:
                 try:
                     csv_params['encoding'] = encoding
-                    df = pd.read_csv(file_path, **csv_params)
+                    if pacsv is not None and not kwargs:
+                        table = pacsv.read_csv(
+                            file_path,
+                            read_options=pacsv.ReadOptions(use_threads=True, encoding=encoding),
+                            convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+                        )
+                        # pyarrow keeps undecodable text as binary instead of raising
+                        if any(pa.types.is_binary(field.type) for field in table.schema):
+                            continue
+                        df = table.to_pandas(date_as_object=False)
+                    else:
+                        df = pd.read_csv(file_path, **csv_params)
                     self.logger.debug(f"Successfully read CSV file: {file_path} with encoding: {encoding}")
+                    if encoding != 'utf-8':
+                        self._encoding_cache[file_path.parent] = encoding
                     return df
                 except UnicodeDecodeError:
                     continue
             
-            # If all encodings fail, raise the last exception
-            raise UnicodeDecodeError(f"Could not decode file {file_path} with any of the attempted encodings")
+            # If all encodings fail, give up on this file
+            raise ValueError(f"Could not decode file {file_path} with any of the attempted encodings")
             
         except Exception as e:
             self.logger.error(f"Error reading CSV file {file_path}: {str(e)}")
             raise
     
+    def _detect_encoding(self, file_path: Path, sample_size: int = 65536) -> str:
+        """
+        Guess the text encoding of a file from a sample of its leading bytes.
+        
+        Args:
+            file_path (Path): Path to the file
+            sample_size (int): Number of bytes to inspect
+        
+        Returns:
+            str: Best-guess encoding name
+        """
+        with open(file_path, 'rb') as f:
+            sample = f.read(sample_size)
+        
+        # Most inputs are UTF-8 (or plain ASCII); the incremental decoder
+        # tolerates a multi-byte character cut off at the end of the sample
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        # Reuse the encoding that worked for a sibling file before sniffing again
+        cached_encoding = self._encoding_cache.get(file_path.parent)
+        if cached_encoding is not None:
+            return cached_encoding
+        
+        if detect_charset is not None:
+            best_match = detect_charset(sample, cp_isolation=FALLBACK_ENCODINGS).best()
+            if best_match is not None:
+                return best_match.encoding
+        
+        return 'latin-1'
+    
+    def read_parquet_file(self, file_path: Path, **kwargs) -> pd.DataFrame:
+        """
+        Read a Parquet file and return a DataFrame.
+        
+        Args:
+            file_path (Path): Path to the Parquet file
+            **kwargs: Additional arguments to pass to pd.read_parquet()
+        
+        Returns:
+            pd.DataFrame: Data from the Parquet file
+        """
+        try:
+            df = pd.read_parquet(file_path, **kwargs)
+            self.logger.debug(f"Successfully read Parquet file: {file_path}")
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Error reading Parquet file {file_path}: {str(e)}")
+            raise
+    
+    def read_feather_file(self, file_path: Path, **kwargs) -> pd.DataFrame:
+        """
+        Read a Feather (Arrow IPC) file and return a DataFrame.
+        
+        Args:
+            file_path (Path): Path to the Feather file
+            **kwargs: Additional arguments to pass to pd.read_feather()
+        
+        Returns:
+            pd.DataFrame: Data from the Feather file
+        """
+        try:
+            feather_params = {'use_threads': True}
+            feather_params.update(kwargs)
+            
+            df = pd.read_feather(file_path, **feather_params)
+            self.logger.debug(f"Successfully read Feather file: {file_path}")
+            return df
+            
+        except Exception as e:
+            self.logger.error(f"Error reading Feather file {file_path}: {str(e)}")
+            raise
+    
     def read_single_file(self, file_path: Path, **kwargs) -> pd.DataFrame:
         """
-        Read a single file (Excel or CSV) and return a DataFrame.
+        Read a single file (Excel, CSV, Parquet or Feather) and return a DataFrame.
         
         Args:
             file_path (Path): Path to the file
@@ -153,12 +318,20 @@ class DataExtractor:
             return self.read_excel_file(file_path, **kwargs)
         elif file_extension == '.csv':
             return self.read_csv_file(file_path, **kwargs)
+        elif file_extension == '.parquet':
+            return self.read_parquet_file(file_path, **kwargs)
+        elif file_extension == '.feather':
+            return self.read_feather_file(file_path, **kwargs)
         else:
             raise ValueError(f"Unsupported file format: {file_extension}")
     
     def extract_data(self, 
                     file_patterns: Optional[List[str]] = None,
                     add_source_column: bool = True,
+                    max_workers: Optional[int] = None,
+                    low_cardinality_cols: Optional[List[str]] = None,
+                    dtype_map: Optional[Dict[str, str]] = None,
+                    parse_dates: Optional[List[str]] = None,
                     **read_kwargs) -> pd.DataFrame:
         """
         Extract data from all discovered files and combine into a single DataFrame.
@@ -166,12 +339,19 @@ class DataExtractor:
         Args:
             file_patterns (List[str], optional): Specific file patterns to search for
             add_source_column (bool): Whether to add a column indicating the source file
+            max_workers (int, optional): Number of threads used to read files concurrently.
+                                         Defaults to one per file, capped at 32.
+            low_cardinality_cols (List[str], optional): Columns to store as 'category' dtype.
+                                                        Defaults to DEFAULT_LOW_CARDINALITY_COLUMNS.
+            dtype_map (Dict[str, str], optional): Column dtypes to apply to the combined data
+            parse_dates (List[str], optional): Columns to parse as datetimes
             **read_kwargs: Additional arguments to pass to file readers
         
         Returns:
             pd.DataFrame: Combined data from all files
         """
         files = self.discover_files(file_patterns)
+        self.last_file_count = len(files)
         
         if not files:
             self.logger.warning("No files found to extract data from")
@@ -179,22 +359,36 @@ class DataExtractor:
         
         all_dataframes = []
         
-        for file_path in files:
-            try:
-                self.logger.info(f"Processing file: {file_path.name}")
-                df = self.read_single_file(file_path, **read_kwargs)
-                
-                # Add source file information if requested
-                if add_source_column:
-                    df['source_file'] = file_path.name
-                    df['source_path'] = str(file_path)
-                
-                all_dataframes.append(df)
-                self.logger.info(f"Successfully processed {file_path.name}: {len(df)} rows")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to process file {file_path.name}: {str(e)}")
-                continue
+        # Read files concurrently; the pandas parsers are I/O bound and release the GIL
+        max_workers = max_workers or min(32, len(files))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Submit the largest files first so a big file queued last doesn't leave
+            # the other workers idle while it is read
+            futures = {
+                file_path: executor.submit(self.read_single_file, file_path, **read_kwargs)
+                for file_path in sorted(files, key=self._file_size, reverse=True)
+            }
+            
+            # Collect results in discovery order so the combined output is deterministic
+            for file_path in files:
+                future = futures[file_path]
+                try:
+                    self.logger.info(f"Processing file: {file_path.name}")
+                    df = future.result()
+                    
+                    # Add source file information if requested, stored as single-category
+                    # columns so each file name is held once rather than once per row
+                    if add_source_column:
+                        codes = np.zeros(len(df), dtype=np.int32)
+                        df['source_file'] = pd.Categorical.from_codes(codes, categories=[file_path.name])
+                        df['source_path'] = pd.Categorical.from_codes(codes, categories=[str(file_path)])
+                    
+                    all_dataframes.append(df)
+                    self.logger.info(f"Successfully processed {file_path.name}: {len(df)} rows")
+                    
+                except Exception as e:
+                    self.logger.error(f"Failed to process file {file_path.name}: {str(e)}")
+                    continue
         
         if not all_dataframes:
             self.logger.error("No files were successfully processed")
@@ -202,7 +396,29 @@ class DataExtractor:
         
         # Combine all DataFrames
         try:
-            combined_df = pd.concat(all_dataframes, ignore_index=True, sort=False)
+            combined_df = self._combine_dataframes(all_dataframes)
+            
+            # Store repetitive text columns as categoricals to cut memory and speed up grouping
+            if low_cardinality_cols is None:
+                low_cardinality_cols = DEFAULT_LOW_CARDINALITY_COLUMNS
+            categorical_cols = [col for col in low_cardinality_cols if col in combined_df.columns]
+            if add_source_column:
+                # pd.concat falls back to object dtype when the per-file categories differ
+                categorical_cols += ['source_file', 'source_path']
+            if categorical_cols:
+                combined_df[categorical_cols] = combined_df[categorical_cols].astype('category')
+            
+            # Apply declared column types once, so later steps never see these
+            # columns as generic objects. Applied after combining because the
+            # Parquet/Feather readers (and pyarrow's CSV path) take no dtype argument.
+            if dtype_map:
+                declared = {col: dtype for col, dtype in dtype_map.items() if col in combined_df.columns}
+                if declared:
+                    combined_df = combined_df.astype(declared)
+            for col in parse_dates or []:
+                if col in combined_df.columns:
+                    combined_df[col] = pd.to_datetime(combined_df[col], errors='coerce')
+            
             self.logger.info(f"Successfully combined {len(all_dataframes)} files into {len(combined_df)} total rows")
             return combined_df
             
@@ -210,6 +426,113 @@ class DataExtractor:
             self.logger.error(f"Error combining DataFrames: {str(e)}")
             raise
     
+    def extract_data_chunks(self, 
+                            chunk_rows: int = 200_000,
+                            file_patterns: Optional[List[str]] = None,
+                            add_source_column: bool = True) -> Iterator[pd.DataFrame]:
+        """
+        Yield the input data as row chunks instead of one combined DataFrame.
+        
+        CSV files are parsed incrementally and Parquet files are read batch by
+        batch (with pyarrow), so at most one chunk of those is held in memory.
+        Excel and Feather files are read whole and then sliced.
+        
+        Args:
+            chunk_rows (int): Maximum number of rows per chunk
+            file_patterns (List[str], optional): Specific file patterns to search for
+            add_source_column (bool): Whether to add a column indicating the source file
+        
+        Yields:
+            pd.DataFrame: Chunk of rows from a single file
+        """
+        files = self.discover_files(file_patterns)
+        self.last_file_count = len(files)
+        
+        for file_path in files:
+            self.logger.info(f"Streaming file: {file_path.name}")
+            file_extension = file_path.suffix.lower()
+            
+            try:
+                if file_extension == '.csv':
+                    chunks = pd.read_csv(file_path, encoding=self._detect_encoding(file_path),
+                                         chunksize=chunk_rows)
+                elif file_extension == '.parquet' and pq is not None:
+                    batches = pq.ParquetFile(file_path).iter_batches(batch_size=chunk_rows)
+                    chunks = (batch.to_pandas() for batch in batches)
+                else:
+                    df = self.read_single_file(file_path)
+                    chunks = (df.iloc[start:start + chunk_rows] for start in range(0, len(df), chunk_rows))
+                
+                for chunk in chunks:
+                    if add_source_column:
+                        chunk = chunk.assign(source_file=file_path.name, source_path=str(file_path))
+                    yield chunk.reset_index(drop=True)
+                    
+            except Exception as e:
+                self.logger.error(f"Failed to stream file {file_path.name}: {str(e)}")
+                continue
+    
+    @staticmethod
+    def _file_size(file_path: Path) -> int:
+        """
+        Get the size of a file in bytes, or 0 if it cannot be read.
+        
+        Args:
+            file_path (Path): Path to the file
+        
+        Returns:
+            int: File size in bytes
+        """
+        try:
+            return file_path.stat().st_size
+        except OSError:
+            return 0
+    
+    def _combine_dataframes(self, dataframes: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate per-file DataFrames into a single DataFrame.
+        
+        Frames that all share the same columns and dtypes go straight to
+        pd.concat, which then joins matching blocks without any reindexing.
+        Otherwise, when pyarrow is available, the frames are concatenated as
+        Arrow tables, which unifies differing schemas column by column, and
+        converted back to pandas once. Files whose schemas cannot be unified
+        (e.g. a date column parsed as text in one file and as a timestamp in
+        another) fall back to pd.concat.
+        
+        Args:
+            dataframes (List[pd.DataFrame]): DataFrames to combine
+        
+        Returns:
+            pd.DataFrame: Combined DataFrame with a fresh RangeIndex
+        """
+        schemas = {self._schema_signature(df) for df in dataframes}
+        
+        if pa is not None and len(schemas) > 1:
+            try:
+                tables = [pa.Table.from_pandas(df, preserve_index=False) for df in dataframes]
+                combined = pa.concat_tables(tables, promote_options='permissive')
+                return combined.to_pandas(self_destruct=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                self.logger.debug(f"Arrow concatenation not possible, using pandas: {str(e)}")
+        
+        return pd.concat(dataframes, ignore_index=True, sort=False)
+    
+    @staticmethod
+    def _schema_signature(df: pd.DataFrame) -> tuple:
+        """
+        Build a hashable description of a DataFrame's columns and dtypes.
+        
+        Categorical columns compare equal regardless of their categories.
+        
+        Args:
+            df (pd.DataFrame): DataFrame to describe
+        
+        Returns:
+            tuple: (column, dtype name) pairs in column order
+        """
+        return tuple((column, str(dtype)) for column, dtype in df.dtypes.items())
+    
     def get_file_info(self, file_patterns: Optional[List[str]] = None) -> Dict[str, Dict]:
         """
         Get information about discovered files without reading their content.
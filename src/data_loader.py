@@ -7,17 +7,44 @@ including Excel files with styling, CSV files, and basic visualizations.
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import csv
+import io
 import logging
-from typing import Dict, List, Optional, Union, Any
+import warnings
+from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
 from pathlib import Path
 from datetime import datetime
-import xlsxwriter
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.chart import BarChart, LineChart, PieChart, Reference
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side, Alignment, NamedStyle
+from openpyxl.utils import get_column_letter
+from formula_compiler import evaluate_formula
+
+# matplotlib, seaborn and openpyxl charts/tables are imported where they are used,
+# so CSV/Excel-only runs do not pay for loading the plotting stack
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+    pacsv = None
+    feather = None
+    pq = None
+
+
+# Write buffer for CSV outputs produced by pandas
+CSV_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Plain Excel exports longer than this are written with xlsxwriter
+XLSXWRITER_ROW_THRESHOLD = 10_000
+
+# Correlation heatmaps wider than this are drawn without per-cell annotations
+MAX_ANNOTATED_HEATMAP_COLUMNS = 200
 
 
 class DataLoader:
@@ -55,16 +82,36 @@ class DataLoader:
             ),
             'alignment': Alignment(horizontal='center', vertical='center')
         }
+        
+        # Header and body styles registered once per workbook and assigned to cells by name
+        self.header_style = NamedStyle(
+            name='etl_header',
+            font=self.default_styles['header_font'],
+            fill=self.default_styles['header_fill'],
+            border=self.default_styles['border'],
+            alignment=self.default_styles['alignment']
+        )
+        self.body_style = NamedStyle(name='etl_body', border=self.default_styles['border'])
+        
+        # Frames longer than this get Parquet instead of a styled Excel report
+        self.excel_row_threshold = 100_000
+        
+        # Rows measured at each end of long frames when sizing Excel columns
+        self.width_sample_size = 1000
+        
+        # Reusable Agg figure for create_visualization, created on first use
+        self._figure = None
     
     def save_to_csv(self, 
-                   df: pd.DataFrame, 
+                   df: Union[pd.DataFrame, 'pa.Table'], 
                    filename: str, 
                    **kwargs) -> str:
         """
         Save DataFrame to CSV file.
         
         Args:
-            df (pd.DataFrame): DataFrame to save
+            df (pd.DataFrame or pa.Table): Data to save; Arrow tables are always
+                written with the PyArrow CSV writer
             filename (str): Name of the output file
             **kwargs: Additional arguments for pandas to_csv()
         
@@ -84,7 +131,28 @@ class DataLoader:
         csv_params.update(kwargs)
         
         try:
-            df.to_csv(output_path, **csv_params)
+            if pa is not None and isinstance(df, pa.Table):
+                pacsv.write_csv(df, str(output_path),
+                                write_options=pacsv.WriteOptions(include_header=True))
+            elif self._can_write_csv_with_arrow(df, csv_params):
+                # Integer-only frames are formatted in C++ by Arrow. The header is
+                # written with Python's csv module, because Arrow always quotes it
+                # while pandas quotes names only when needed.
+                header = io.StringIO()
+                csv.writer(header, lineterminator='\n').writerow([str(c) for c in df.columns])
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                with open(output_path, 'wb') as f:
+                    f.write(header.getvalue().encode('utf-8'))
+                    pacsv.write_csv(table, f, write_options=pacsv.WriteOptions(
+                        include_header=False, quoting_style='none'))
+            elif 'compression' in csv_params:
+                df.to_csv(output_path, **csv_params)
+            else:
+                # A 4 MiB buffer flushes far less often than the default 8 KiB one
+                to_csv_params = {k: v for k, v in csv_params.items() if k not in ('encoding', 'mode')}
+                with open(output_path, csv_params.get('mode', 'w'), encoding=csv_params['encoding'],
+                          buffering=CSV_WRITE_BUFFER_SIZE, newline='') as f:
+                    df.to_csv(f, **to_csv_params)
             self.logger.info(f"Successfully saved CSV file: {output_path}")
             return str(output_path)
             
@@ -92,6 +160,176 @@ class DataLoader:
             self.logger.error(f"Error saving CSV file {filename}: {str(e)}")
             raise
     
+    def save_to_feather(self, 
+                       df: Union[pd.DataFrame, 'pa.Table'], 
+                       filename: str, 
+                       compression: str = 'lz4') -> str:
+        """
+        Save DataFrame to an Apache Arrow Feather file.
+        
+        Feather skips text formatting and quoting entirely, so writes are
+        typically an order of magnitude faster than to_csv on numeric frames
+        and the file reloads almost instantly in Python or R.
+        
+        Args:
+            df (pd.DataFrame or pa.Table): Data to save
+            filename (str): Name of the output file
+            compression (str): Feather compression codec ('lz4', 'zstd' or 'uncompressed')
+        
+        Returns:
+            str: Path to the saved file
+        """
+        if not filename.endswith('.feather'):
+            filename += '.feather'
+        
+        output_path = self.output_directory / filename
+        
+        try:
+            if feather is None:
+                raise ImportError("pyarrow is required to write Feather files")
+            
+            try:
+                feather.write_feather(df, str(output_path), compression=compression)
+            except (TypeError, ValueError):
+                converted = self._stringify_mixed_columns(df)
+                if converted is None:
+                    raise
+                feather.write_feather(converted, str(output_path), compression=compression)
+            self.logger.info(f"Successfully saved Feather file: {output_path}")
+            return str(output_path)
+            
+        except Exception as e:
+            self.logger.error(f"Error saving Feather file {filename}: {str(e)}")
+            raise
+    
+    def save_to_parquet(self, 
+                       df: Union[pd.DataFrame, 'pa.Table'], 
+                       filename: str, 
+                       compression: str = 'snappy') -> str:
+        """
+        Save DataFrame to a Parquet file.
+        
+        Parquet's dictionary/RLE encoding and column statistics keep large
+        reports small and cheap to filter when they are read back.
+        
+        Args:
+            df (pd.DataFrame or pa.Table): Data to save
+            filename (str): Name of the output file
+            compression (str): Parquet compression codec
+        
+        Returns:
+            str: Path to the saved file
+        """
+        if not filename.endswith('.parquet'):
+            filename += '.parquet'
+        
+        output_path = self.output_directory / filename
+        
+        try:
+            if pa is not None and isinstance(df, pa.Table):
+                pq.write_table(df, str(output_path), compression=compression)
+            else:
+                try:
+                    df.to_parquet(output_path, engine='pyarrow', compression=compression, index=False)
+                except (TypeError, ValueError):
+                    converted = self._stringify_mixed_columns(df)
+                    if converted is None:
+                        raise
+                    converted.to_parquet(output_path, engine='pyarrow', compression=compression, index=False)
+            self.logger.info(f"Successfully saved Parquet file: {output_path}")
+            return str(output_path)
+            
+        except Exception as e:
+            self.logger.error(f"Error saving Parquet file {filename}: {str(e)}")
+            raise
+    
+    def _stringify_mixed_columns(self, df: Union[pd.DataFrame, 'pa.Table']) -> Optional[pd.DataFrame]:
+        """
+        Write object columns that mix value types (e.g. dates and text) as strings.
+        
+        Arrow-based formats need a single type per column, so such columns make
+        Feather and Parquet writes fail.
+        
+        Args:
+            df (pd.DataFrame or pa.Table): Data that failed to convert
+        
+        Returns:
+            Optional[pd.DataFrame]: Copy with mixed columns as strings, or None
+                if there is nothing to convert
+        """
+        if not isinstance(df, pd.DataFrame):
+            return None
+        
+        mixed_columns = [
+            column for column, dtype in df.dtypes.items()
+            if dtype == object and pd.api.types.infer_dtype(df[column], skipna=True).startswith('mixed')
+        ]
+        if not mixed_columns:
+            return None
+        
+        self.logger.warning(f"Writing mixed-type columns as text: {', '.join(map(str, mixed_columns))}")
+        converted = df.copy(deep=False)
+        for column in mixed_columns:
+            converted[column] = df[column].map(str, na_action='ignore')
+        return converted
+    
+    def _shared_arrow_table(self, 
+                            df: pd.DataFrame, 
+                            formats: List[str], 
+                            csv_via_arrow: bool) -> Optional['pa.Table']:
+        """
+        Convert a DataFrame to Arrow once when several Arrow-backed outputs need it.
+        
+        Args:
+            df (pd.DataFrame): DataFrame being exported
+            formats (List[str]): Requested report formats
+            csv_via_arrow (bool): Whether the CSV output takes the Arrow writer
+        
+        Returns:
+            Optional[pa.Table]: Shared table, or None if fewer than two outputs
+                would use it or the frame cannot be converted
+        """
+        if pa is None:
+            return None
+        
+        arrow_outputs = {'feather', 'parquet'}.intersection(formats)
+        if csv_via_arrow:
+            arrow_outputs.add('csv')
+        if 'excel_styled' in formats and len(df) > self.excel_row_threshold:
+            arrow_outputs.add('parquet')
+        if len(arrow_outputs) < 2:
+            return None
+        
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            self.logger.debug(f"Falling back to per-format conversion: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _can_write_csv_with_arrow(df: pd.DataFrame, csv_params: Dict) -> bool:
+        """
+        Check whether a DataFrame can take the PyArrow CSV writer fast path.
+        
+        Args:
+            df (pd.DataFrame): DataFrame to save
+            csv_params (Dict): Effective to_csv parameters
+        
+        Returns:
+            bool: True if every column is an integer column and only the default
+                index/encoding options are in use. Arrow formats floats, booleans
+                and datetimes differently from pandas (1 vs 1.0, true vs True,
+                fractional seconds), so those frames keep the pandas writer.
+        """
+        if pacsv is None or len(df.columns) == 0:
+            return False
+        if csv_params.keys() - {'index', 'encoding'} or csv_params['index']:
+            return False
+        if str(csv_params['encoding']).lower().replace('_', '-') not in ('utf-8', 'utf8'):
+            return False
+        
+        return all(pd.api.types.is_integer_dtype(dtype) for dtype in df.dtypes)
+    
     def save_to_excel_simple(self, 
                            df: pd.DataFrame, 
                            filename: str, 
@@ -119,6 +357,11 @@ class DataLoader:
             'index': False,
             'engine': 'openpyxl'
         }
+        if len(df) > XLSXWRITER_ROW_THRESHOLD and 'engine' not in kwargs:
+            # xlsxwriter writes large values-only sheets faster than openpyxl.
+            # Its constant_memory mode is not used: to_excel writes cell by cell
+            # across rows, and that mode drops cells of rows already flushed.
+            excel_params['engine'] = 'xlsxwriter'
         excel_params.update(kwargs)
         
         try:
@@ -155,61 +398,50 @@ class DataLoader:
         output_path = self.output_directory / filename
         
         try:
-            # First save with pandas
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                df.to_excel(writer, sheet_name=sheet_name, index=False)
+            # Build the workbook in write-only mode: rows are streamed to disk as they
+            # are appended instead of being saved, reloaded and restyled cell by cell
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(sheet_name)
             
             if apply_styling:
-                # Load the workbook for styling
-                wb = load_workbook(output_path)
-                ws = wb[sheet_name]
-                
-                # Apply header styling
-                for cell in ws[1]:  # First row (headers)
-                    cell.font = self.default_styles['header_font']
-                    cell.fill = self.default_styles['header_fill']
-                    cell.alignment = self.default_styles['alignment']
-                    cell.border = self.default_styles['border']
+                wb.add_named_style(self.header_style)
+                wb.add_named_style(self.body_style)
                 
-                # Apply border to all cells
-                for row in ws.iter_rows(min_row=1, max_row=ws.max_row, 
-                                      min_col=1, max_col=ws.max_column):
-                    for cell in row:
-                        cell.border = self.default_styles['border']
+                # Auto-adjust column widths (must be set before any rows are written)
+                for column_letter, width in self._compute_col_widths(df).items():
+                    ws.column_dimensions[column_letter].width = width
+            
+            self._append_dataframe(
+                ws, df,
+                header_style=self.header_style.name if apply_styling else None,
+                body_style=self.body_style.name if apply_styling else None
+            )
+            
+            # Create table if requested
+            if apply_styling and create_table and len(df) > 0:
+                from openpyxl.worksheet.table import Table, TableStyleInfo
                 
-                # Auto-adjust column widths
-                for column in ws.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    ws.column_dimensions[column_letter].width = adjusted_width
+                table_range = f"A1:{get_column_letter(len(df.columns))}{len(df) + 1}"
+                table = Table(displayName=f"Table_{sheet_name}", ref=table_range)
+                # Write-only sheets cannot read the headings back, so name the columns here
+                table._initialise_columns()
+                for table_column, column in zip(table.tableColumns, df.columns):
+                    table_column.name = str(column)
                 
-                # Create table if requested
-                if create_table:
-                    from openpyxl.worksheet.table import Table, TableStyleInfo
-                    
-                    table_range = f"A1:{ws.max_column_letter}{ws.max_row}"
-                    table = Table(displayName=f"Table_{sheet_name}", ref=table_range)
-                    
-                    style = TableStyleInfo(
-                        name="TableStyleMedium9", 
-                        showFirstColumn=False,
-                        showLastColumn=False, 
-                        showRowStripes=True, 
-                        showColumnStripes=True
-                    )
-                    table.tableStyleInfo = style
+                style = TableStyleInfo(
+                    name="TableStyleMedium9", 
+                    showFirstColumn=False,
+                    showLastColumn=False, 
+                    showRowStripes=True, 
+                    showColumnStripes=True
+                )
+                table.tableStyleInfo = style
+                with warnings.catch_warnings():
+                    # Columns were named above; silence openpyxl's write-only reminder
+                    warnings.simplefilter('ignore', UserWarning)
                     ws.add_table(table)
-                
-                wb.save(output_path)
+            
+            wb.save(output_path)
             
             self.logger.info(f"Successfully saved styled Excel file: {output_path}")
             return str(output_path)
@@ -218,6 +450,77 @@ class DataLoader:
             self.logger.error(f"Error saving styled Excel file {filename}: {str(e)}")
             raise
     
+    def _append_dataframe(self, 
+                          worksheet, 
+                          df: pd.DataFrame, 
+                          header_style: Optional[str] = None,
+                          body_style: Optional[str] = None):
+        """
+        Stream a DataFrame into a write-only worksheet, header first.
+        
+        Args:
+            worksheet: Write-only worksheet to append to
+            df (pd.DataFrame): DataFrame to write
+            header_style (str): Name of a registered style for the header cells
+            body_style (str): Name of a registered style for the data cells
+        """
+        header_cells = []
+        for column in df.columns:
+            cell = WriteOnlyCell(worksheet, value=str(column))
+            if header_style:
+                cell.style = header_style
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        
+        # Missing values become empty cells, as with DataFrame.to_excel
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            if body_style:
+                row = [self._styled_cell(worksheet, value, body_style) for value in row]
+            worksheet.append(row)
+    
+    @staticmethod
+    def _styled_cell(worksheet, value, style: str) -> WriteOnlyCell:
+        """
+        Create a write-only cell carrying a registered named style.
+        
+        Args:
+            worksheet: Write-only worksheet the cell belongs to
+            value: Cell value
+            style (str): Name of the style to apply
+        
+        Returns:
+            WriteOnlyCell: Styled cell ready to be appended
+        """
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.style = style
+        return cell
+    
+    def _compute_col_widths(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        Compute Excel column widths from the longest rendered value per column.
+        
+        Long frames are measured on their first and last width_sample_size rows
+        only, which keeps the styling pass independent of the row count.
+        
+        Args:
+            df (pd.DataFrame): DataFrame that will be written to the sheet
+        
+        Returns:
+            Dict[str, int]: Column letter to width, capped at 50 characters
+        """
+        if len(df) > 5 * self.width_sample_size:
+            df = pd.concat([df.head(self.width_sample_size), df.tail(self.width_sample_size)])
+        
+        header_len = np.array([len(str(column)) for column in df.columns], dtype=float)
+        if len(df) > 0:
+            body_len = df.astype(str).apply(lambda s: s.str.len().max()).to_numpy(dtype=float)
+        else:
+            body_len = np.zeros(len(df.columns))
+        
+        widths = np.minimum(np.maximum(header_len, np.nan_to_num(body_len)) + 2, 50)
+        return {get_column_letter(i + 1): int(width) for i, width in enumerate(widths)}
+    
     def create_summary_sheet(self, 
                            df: pd.DataFrame, 
                            filename: str,
@@ -242,30 +545,52 @@ class DataLoader:
             summary_config = {}
         
         try:
-            # Create Excel writer
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                # Save original data
-                df.to_excel(writer, sheet_name='Data', index=False)
-                
-                # Create summary data
-                summary_data = self._generate_summary_data(df, summary_config)
-                summary_df = pd.DataFrame(list(summary_data.items()), 
-                                        columns=['Metric', 'Value'])
-                
-                # Save summary sheet
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
+            # Build every sheet and chart in one write-only workbook and save it once
+            wb = Workbook(write_only=True)
+            wb.add_named_style(self.header_style)
+            
+            # Save original data
+            self._append_dataframe(wb.create_sheet('Data'), df)
+            
+            # Create summary data as plain (metric, value) rows; numpy scalars are
+            # unwrapped so openpyxl writes them without any per-cell type sniffing
+            summary_data = self._generate_summary_data(df, summary_config)
+            summary_rows = [
+                (metric, None if pd.isna(value) else value.item() if isinstance(value, np.generic) else value)
+                for metric, value in summary_data.items()
+            ]
+            
+            # Save summary sheet with a styled header and fitted columns
+            ws_summary = wb.create_sheet('Summary')
+            header = ('Metric', 'Value')
+            for col_idx, column in enumerate(header):
+                max_length = max([len(column)] + [len(str(row[col_idx])) for row in summary_rows])
+                ws_summary.column_dimensions[get_column_letter(col_idx + 1)].width = min(max_length + 2, 50)
+            
+            header_cells = []
+            for column in header:
+                cell = WriteOnlyCell(ws_summary, value=column)
+                cell.style = self.header_style.name
+                header_cells.append(cell)
+            ws_summary.append(header_cells)
+            for row in summary_rows:
+                ws_summary.append(row)
+            
+            # Create aggregated data if specified
+            if 'group_by' in summary_config:
+                group_cols = summary_config['group_by']
+                agg_funcs = summary_config.get('aggregations', {'count': 'count'})
                 
-                # Create aggregated data if specified
-                if 'group_by' in summary_config:
-                    group_cols = summary_config['group_by']
-                    agg_funcs = summary_config.get('aggregations', {'count': 'count'})
-                    
-                    if all(col in df.columns for col in group_cols):
-                        agg_df = df.groupby(group_cols).agg(agg_funcs).reset_index()
-                        agg_df.to_excel(writer, sheet_name='Aggregated', index=False)
+                if all(col in df.columns for col in group_cols):
+                    agg_df = df.groupby(group_cols).agg(agg_funcs).reset_index()
+                    self._append_dataframe(wb.create_sheet('Aggregated'), agg_df)
+            
+            # Create a simple bar chart for numeric data
+            numeric_cols = df.select_dtypes(include=[np.number]).columns
+            if len(numeric_cols) > 0 and len(df) > 1:
+                self._add_bar_chart(wb, df, numeric_cols[:3])  # Limit to first 3 numeric columns
             
-            # Add styling and charts
-            self._add_summary_styling_and_charts(output_path, df, summary_config)
+            wb.save(output_path)
             
             self.logger.info(f"Successfully created summary report: {output_path}")
             return str(output_path)
@@ -290,120 +615,82 @@ class DataLoader:
         # Basic statistics
         summary['Total Rows'] = len(df)
         summary['Total Columns'] = len(df.columns)
-        summary['Missing Values'] = df.isnull().sum().sum()
+        summary['Missing Values'] = int(df.isna().to_numpy().sum())
         
-        # Numeric column statistics
+        # Numeric column statistics, one aggregation call for all columns
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         if len(numeric_cols) > 0:
+            # Mean is aggregated separately so integer totals/extremes keep their dtype
+            stats = df[numeric_cols].agg(['sum', 'max', 'min'])
+            means = df[numeric_cols].mean()
             for col in numeric_cols:
-                summary[f'{col} - Total'] = df[col].sum()
-                summary[f'{col} - Average'] = round(df[col].mean(), 2)
-                summary[f'{col} - Max'] = df[col].max()
-                summary[f'{col} - Min'] = df[col].min()
+                summary[f'{col} - Total'] = stats.at['sum', col]
+                summary[f'{col} - Average'] = round(means[col], 2)
+                summary[f'{col} - Max'] = stats.at['max', col]
+                summary[f'{col} - Min'] = stats.at['min', col]
         
         # Categorical column statistics
         categorical_cols = df.select_dtypes(include=['object', 'category']).columns
-        for col in categorical_cols:
-            if col != 'source_file' and col != 'source_path':  # Skip metadata columns
-                unique_count = df[col].nunique()
+        categorical_cols = categorical_cols.difference(['source_file', 'source_path'], sort=False)  # Skip metadata columns
+        if len(categorical_cols) > 0:
+            unique_counts = df[categorical_cols].nunique()
+            for col in categorical_cols:
+                unique_count = unique_counts[col]
                 summary[f'{col} - Unique Values'] = unique_count
-                if unique_count <= 10:  # Show top values for small categories
-                    top_value = df[col].value_counts().index[0]
-                    summary[f'{col} - Top Value'] = top_value
+                if 0 < unique_count <= 10:  # Show top values for small categories
+                    summary[f'{col} - Top Value'] = df[col].value_counts(dropna=True).index[0]
         
         # Custom KPIs from config
         custom_kpis = config.get('custom_kpis', {})
         for kpi_name, kpi_formula in custom_kpis.items():
             try:
-                result = df.eval(kpi_formula).sum() if 'sum' in kpi_formula else df.eval(kpi_formula).iloc[0]
+                result = self._evaluate_kpi(df, kpi_formula)
+                result = result.sum() if 'sum' in kpi_formula else result.iloc[0]
                 summary[kpi_name] = result
             except Exception as e:
                 self.logger.warning(f"Failed to calculate custom KPI {kpi_name}: {str(e)}")
         
         return summary
     
-    def _add_summary_styling_and_charts(self, 
-                                      file_path: str, 
-                                      df: pd.DataFrame, 
-                                      config: Dict):
+    def _evaluate_kpi(self, df: pd.DataFrame, formula: str) -> Any:
         """
-        Add styling and charts to the summary Excel file.
+        Evaluate a custom KPI formula against the DataFrame's columns.
+        
+        Column arithmetic, comparisons and argument-free reductions such as
+        'total_amount.sum()' (see formula_compiler.KPI_REDUCTIONS) reuse a cached
+        compiled expression; anything else goes through DataFrame.eval.
         
         Args:
-            file_path (str): Path to the Excel file
-            df (pd.DataFrame): Original DataFrame
-            config (Dict): Configuration for charts and styling
+            df (pd.DataFrame): DataFrame providing the column values
+            formula (str): KPI expression, e.g. 'total_amount.sum()'
+        
+        Returns:
+            Any: Scalar or Series result of the expression
         """
-        try:
-            wb = load_workbook(file_path)
-            
-            # Style summary sheet
-            if 'Summary' in wb.sheetnames:
-                ws_summary = wb['Summary']
-                
-                # Apply header styling
-                for cell in ws_summary[1]:
-                    cell.font = self.default_styles['header_font']
-                    cell.fill = self.default_styles['header_fill']
-                    cell.alignment = self.default_styles['alignment']
-                
-                # Auto-adjust column widths
-                for column in ws_summary.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    
-                    adjusted_width = min(max_length + 2, 50)
-                    ws_summary.column_dimensions[column_letter].width = adjusted_width
-            
-            # Add charts if data sheet exists
-            if 'Data' in wb.sheetnames:
-                ws_data = wb['Data']
-                
-                # Create a simple bar chart for numeric data
-                numeric_cols = df.select_dtypes(include=[np.number]).columns
-                if len(numeric_cols) > 0 and len(df) > 1:
-                    self._add_bar_chart(wb, ws_data, df, numeric_cols[:3])  # Limit to first 3 numeric columns
-            
-            wb.save(file_path)
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to add styling and charts: {str(e)}")
+        return evaluate_formula(df, formula, allow_reductions=True)
     
-    def _add_bar_chart(self, workbook, worksheet, df: pd.DataFrame, columns: List[str]):
+    def _add_bar_chart(self, workbook, df: pd.DataFrame, columns: List[str]):
         """
-        Add a bar chart to the worksheet.
+        Add a Charts sheet with a bar chart to the workbook.
         
         Args:
             workbook: Excel workbook object
-            worksheet: Excel worksheet object
             df (pd.DataFrame): Data for the chart
             columns (List[str]): Columns to include in the chart
         """
         try:
+            from openpyxl.chart import BarChart, Reference
+            
             # Create a new sheet for charts
-            if 'Charts' not in workbook.sheetnames:
-                chart_sheet = workbook.create_sheet('Charts')
-            else:
-                chart_sheet = workbook['Charts']
+            chart_sheet = workbook.create_sheet('Charts')
             
-            # Prepare data for chart (aggregate if too many rows)
-            if len(df) > 20:
-                # If too many rows, create aggregated data
-                chart_data = df[columns].head(20)
-            else:
-                chart_data = df[columns]
+            # Prepare data for chart (first 20 rows at most)
+            chart_data = df[columns].head(20)
             
-            # Write chart data to chart sheet
-            for r_idx, row in enumerate(dataframe_to_rows(chart_data, index=False, header=True), 1):
-                for c_idx, value in enumerate(row, 1):
-                    chart_sheet.cell(row=r_idx, column=c_idx, value=value)
+            # Write chart data to chart sheet row by row
+            chart_sheet.append([str(column) for column in chart_data.columns])
+            for row in chart_data.itertuples(index=False, name=None):
+                chart_sheet.append(row)
             
             # Create bar chart
             chart = BarChart()
@@ -451,64 +738,100 @@ class DataLoader:
         output_path = self.output_directory / filename
         
         try:
-            plt.figure(figsize=kwargs.get('figsize', (10, 6)))
+            fig = self._get_figure(kwargs.get('figsize', (10, 6)))
+            ax = fig.add_subplot()
             
             if chart_type == 'bar':
                 x_col = kwargs.get('x', df.columns[0])
                 y_col = kwargs.get('y', df.columns[1] if len(df.columns) > 1 else df.columns[0])
-                plt.bar(df[x_col], df[y_col])
-                plt.xlabel(x_col)
-                plt.ylabel(y_col)
-                plt.title(kwargs.get('title', f'{y_col} by {x_col}'))
-                plt.xticks(rotation=45)
+                ax.bar(df[x_col], df[y_col])
+                ax.set_xlabel(x_col)
+                ax.set_ylabel(y_col)
+                ax.set_title(kwargs.get('title', f'{y_col} by {x_col}'))
+                ax.tick_params(axis='x', labelrotation=45)
                 
             elif chart_type == 'line':
                 x_col = kwargs.get('x', df.columns[0])
                 y_col = kwargs.get('y', df.columns[1] if len(df.columns) > 1 else df.columns[0])
-                plt.plot(df[x_col], df[y_col], marker='o')
-                plt.xlabel(x_col)
-                plt.ylabel(y_col)
-                plt.title(kwargs.get('title', f'{y_col} over {x_col}'))
-                plt.xticks(rotation=45)
+                ax.plot(df[x_col], df[y_col], marker='o')
+                ax.set_xlabel(x_col)
+                ax.set_ylabel(y_col)
+                ax.set_title(kwargs.get('title', f'{y_col} over {x_col}'))
+                ax.tick_params(axis='x', labelrotation=45)
                 
             elif chart_type == 'pie':
                 values_col = kwargs.get('values', df.columns[0])
                 labels_col = kwargs.get('labels', df.columns[1] if len(df.columns) > 1 else None)
                 
                 if labels_col:
-                    plt.pie(df[values_col], labels=df[labels_col], autopct='%1.1f%%')
+                    ax.pie(df[values_col], labels=df[labels_col], autopct='%1.1f%%')
                 else:
-                    plt.pie(df[values_col], autopct='%1.1f%%')
-                plt.title(kwargs.get('title', f'Distribution of {values_col}'))
+                    ax.pie(df[values_col], autopct='%1.1f%%')
+                ax.set_title(kwargs.get('title', f'Distribution of {values_col}'))
                 
             elif chart_type == 'scatter':
                 x_col = kwargs.get('x', df.columns[0])
                 y_col = kwargs.get('y', df.columns[1] if len(df.columns) > 1 else df.columns[0])
-                plt.scatter(df[x_col], df[y_col], alpha=0.6)
-                plt.xlabel(x_col)
-                plt.ylabel(y_col)
-                plt.title(kwargs.get('title', f'{y_col} vs {x_col}'))
+                ax.scatter(df[x_col], df[y_col], alpha=0.6)
+                ax.set_xlabel(x_col)
+                ax.set_ylabel(y_col)
+                ax.set_title(kwargs.get('title', f'{y_col} vs {x_col}'))
                 
             elif chart_type == 'heatmap':
-                numeric_df = df.select_dtypes(include=[np.number])
+                import seaborn as sns
+                
+                # float32 halves the memory traffic of the correlation pass
+                numeric_df = df.select_dtypes(include=[np.number]).astype(np.float32, copy=False)
                 if len(numeric_df.columns) > 1:
-                    correlation_matrix = numeric_df.corr()
-                    sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0)
-                    plt.title(kwargs.get('title', 'Correlation Heatmap'))
+                    correlation_matrix = numeric_df.corr(numeric_only=True)
+                    # Annotating every cell of a very wide matrix is O(n^2) text objects
+                    annot = kwargs.get('annot', len(correlation_matrix.columns) <= MAX_ANNOTATED_HEATMAP_COLUMNS)
+                    sns.heatmap(correlation_matrix, annot=annot, cmap='coolwarm', center=0,
+                                vmin=-1, vmax=1, ax=ax)
+                    ax.set_title(kwargs.get('title', 'Correlation Heatmap'))
                 else:
                     raise ValueError("Heatmap requires at least 2 numeric columns")
             
-            plt.tight_layout()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-            plt.close()
+            # Lay out once up front so savefig does not need a second
+            # bbox_inches='tight' render pass
+            fig.tight_layout()
+            fig.savefig(output_path, dpi=kwargs.get('dpi', 150))
             
             self.logger.info(f"Successfully created visualization: {output_path}")
             return str(output_path)
             
         except Exception as e:
             self.logger.error(f"Error creating visualization {filename}: {str(e)}")
-            plt.close()  # Ensure plot is closed even on error
             raise
+        
+        finally:
+            # Keep the figure for the next chart but drop this chart's artists
+            if self._figure is not None:
+                self._figure.clear()
+    
+    def _get_figure(self, figsize: tuple) -> 'Figure':
+        """
+        Return the loader's reusable Agg figure, resized for the next chart.
+        
+        Args:
+            figsize (tuple): Figure size in inches (width, height)
+        
+        Returns:
+            Figure: Empty matplotlib figure
+        """
+        if self._figure is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            
+            # Standalone Agg figures are not tracked by pyplot, never start a GUI
+            # backend and need no plt.close()
+            self._figure = Figure(figsize=figsize)
+            FigureCanvasAgg(self._figure)
+        else:
+            self._figure.clear()
+            self._figure.set_size_inches(figsize)
+        
+        return self._figure
     
     def create_multi_format_report(self, 
                                  df: pd.DataFrame, 
@@ -521,7 +844,9 @@ class DataLoader:
         Args:
             df (pd.DataFrame): DataFrame to export
             base_filename (str): Base name for output files
-            formats (List[str]): List of formats ('csv', 'excel', 'excel_styled', 'summary')
+            formats (List[str]): List of formats ('csv', 'excel', 'excel_styled', 'summary',
+                'feather', 'parquet'). Styled Excel is replaced by Parquet for frames
+                longer than excel_row_threshold rows.
             config (Dict): Configuration for report generation
         
         Returns:
@@ -535,10 +860,16 @@ class DataLoader:
         
         output_files = {}
         
+        # CSV (for numeric frames), Feather and Parquet can share one Arrow conversion
+        csv_via_arrow = 'csv' in formats and self._can_write_csv_with_arrow(df, {'index': False, 'encoding': 'utf-8'})
+        arrow_table = self._shared_arrow_table(df, formats, csv_via_arrow)
+        arrow_source = df if arrow_table is None else arrow_table
+        csv_source = arrow_table if arrow_table is not None and csv_via_arrow else df
+        
         for format_type in formats:
             try:
                 if format_type == 'csv':
-                    path = self.save_to_csv(df, f"{base_filename}.csv")
+                    path = self.save_to_csv(csv_source, f"{base_filename}.csv")
                     output_files['csv'] = path
                     
                 elif format_type == 'excel':
@@ -546,6 +877,14 @@ class DataLoader:
                     output_files['excel'] = path
                     
                 elif format_type == 'excel_styled':
+                    if len(df) > self.excel_row_threshold:
+                        self.logger.warning(
+                            f"Skipping styled Excel for {len(df)} rows "
+                            f"(threshold {self.excel_row_threshold}); writing Parquet instead"
+                        )
+                        if 'parquet' not in formats:
+                            output_files['parquet'] = self.save_to_parquet(arrow_source, f"{base_filename}.parquet")
+                        continue
                     path = self.save_to_excel_styled(df, f"{base_filename}_styled.xlsx")
                     output_files['excel_styled'] = path
                     
@@ -553,6 +892,14 @@ class DataLoader:
                     path = self.create_summary_sheet(df, f"{base_filename}_summary.xlsx", config)
                     output_files['summary'] = path
                     
+                elif format_type == 'feather':
+                    path = self.save_to_feather(arrow_source, f"{base_filename}.feather")
+                    output_files['feather'] = path
+                    
+                elif format_type == 'parquet':
+                    path = self.save_to_parquet(arrow_source, f"{base_filename}.parquet")
+                    output_files['parquet'] = path
+                    
             except Exception as e:
                 self.logger.error(f"Failed to create {format_type} format: {str(e)}")
         
@@ -8,9 +8,20 @@ It provides comprehensive functionality to process raw data into analysis-ready
 import pandas as pd
 import numpy as np
 import logging
+from pandas.api.types import (
+    is_bool_dtype, is_datetime64_any_dtype, is_integer_dtype, is_numeric_dtype
+)
 from typing import Dict, List, Optional, Union, Callable, Any
 from datetime import datetime, timedelta
 import re
+import ast
+from formula_compiler import evaluate_formula
+
+
+# Column-name cleanup patterns, compiled once and shared by every call
+_RE_NONALNUM = re.compile(r'[^a-z0-9_]')
+_RE_MULTI_US = re.compile(r'_+')
+_RE_IDENTIFIER = re.compile(r'[A-Za-z_]\w*')
 
 
 class DataTransformer:
@@ -49,7 +60,8 @@ class DataTransformer:
             'details': details
         }
         self.transformation_log.append(log_entry)
-        self.logger.info(f"{operation}: {details}")
+        # Arguments are only formatted when INFO records are emitted
+        self.logger.info("%s: %s", operation, details)
     
     def standardize_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -63,20 +75,16 @@ class DataTransformer:
         """
         original_columns = df.columns.tolist()
         
-        # Standardize column names
-        new_columns = []
-        for col in df.columns:
-            # Convert to lowercase
-            new_col = str(col).lower()
-            # Replace spaces and special characters with underscores
-            new_col = re.sub(r'[^a-z0-9_]', '_', new_col)
-            # Remove multiple consecutive underscores
-            new_col = re.sub(r'_+', '_', new_col)
-            # Remove leading/trailing underscores
-            new_col = new_col.strip('_')
-            new_columns.append(new_col)
-        
-        df.columns = new_columns
+        # Standardize column names with vectorized string ops on the column Index:
+        # lowercase, replace spaces/special characters with underscores, collapse
+        # repeated underscores and trim leading/trailing ones
+        df.columns = (
+            df.columns.map(str)
+            .str.lower()
+            .str.replace(_RE_NONALNUM, '_', regex=True)
+            .str.replace(_RE_MULTI_US, '_', regex=True)
+            .str.strip('_')
+        )
         
         self.log_transformation(
             "Column Standardization",
@@ -85,6 +93,37 @@ class DataTransformer:
         
         return df
     
+    def _to_arrow_strings(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store object columns that hold only strings as PyArrow-backed strings.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame
+        
+        Returns:
+            pd.DataFrame: DataFrame with contiguous Arrow string columns
+        """
+        try:
+            arrow_string = pd.StringDtype('pyarrow')
+        except ImportError:
+            self.logger.warning("pyarrow is not installed; keeping object string columns")
+            return df
+        
+        converted = []
+        for column in df.select_dtypes(include=['object']).columns:
+            # Mixed-type columns stay object so numbers are not turned into text
+            if pd.api.types.infer_dtype(df[column], skipna=True) == 'string':
+                df[column] = df[column].astype(arrow_string)
+                converted.append(column)
+        
+        if converted:
+            self.log_transformation(
+                "Arrow String Conversion",
+                f"Converted {len(converted)} columns to Arrow strings: {', '.join(converted)}"
+            )
+        
+        return df
+    
     def handle_missing_values(self, 
                             df: pd.DataFrame, 
                             strategy: Dict[str, Union[str, Any]] = None) -> pd.DataFrame:
@@ -103,34 +142,68 @@ class DataTransformer:
             strategy = {}
         
         original_shape = df.shape
-        missing_before = df.isnull().sum().sum()
         
-        for column in df.columns:
-            if column in strategy:
-                method = strategy[column]
-                
-                if method == 'drop':
-                    df = df.dropna(subset=[column])
-                elif method == 'fill':
-                    if df[column].dtype in ['int64', 'float64']:
-                        df[column] = df[column].fillna(df[column].mean())
-                    else:
-                        df[column] = df[column].fillna('Unknown')
-                elif method == 'forward':
-                    df[column] = df[column].fillna(method='ffill')
-                elif method == 'backward':
-                    df[column] = df[column].fillna(method='bfill')
-                else:
-                    # Fill with specific value
-                    df[column] = df[column].fillna(method)
-            else:
-                # Default strategy: fill numeric with mean, categorical with 'Unknown'
-                if df[column].dtype in ['int64', 'float64']:
+        # Count gaps once; the remaining count per column is then tracked from the
+        # fills themselves instead of rescanning the whole frame afterwards
+        remaining = df.isna().sum()
+        missing_before = int(remaining.sum())
+        rows_dropped = False
+        
+        # Explicit per-column strategies
+        for column, method in strategy.items():
+            if column not in df.columns:
+                continue
+            
+            if method == 'drop':
+                df = df.dropna(subset=[column])
+                rows_dropped = True
+                continue
+            elif method == 'fill':
+                if self._is_fillable_numeric(df[column]):
                     df[column] = df[column].fillna(df[column].mean())
                 else:
-                    df[column] = df[column].fillna('Unknown')
-        
-        missing_after = df.isnull().sum().sum()
+                    df[column] = self._fill_unknown(df[column])
+            elif method == 'forward':
+                df[column] = df[column].ffill()
+            elif method == 'backward':
+                df[column] = df[column].bfill()
+            else:
+                # Fill with specific value
+                df[column] = df[column].fillna(method)
+            remaining[column] = df[column].isna().sum()
+        
+        if rows_dropped:
+            # Dropped rows change every column's count
+            remaining = df.isna().sum()
+        
+        # Default strategy: fill numeric with mean, categorical with 'Unknown'.
+        # Only columns that still have gaps are touched, one batch per kind.
+        default_columns = df.columns.difference(list(strategy), sort=False)
+        has_missing = remaining[default_columns] > 0
+        columns_with_missing = has_missing.index[has_missing.to_numpy()]
+        
+        numeric_columns = [col for col in columns_with_missing if self._is_fillable_numeric(df[col])]
+        fill_values = {}
+        if numeric_columns:
+            means = df[numeric_columns].mean()
+            # All-missing columns have no mean and stay missing
+            fill_values.update(means.dropna().to_dict())
+            remaining[numeric_columns] = remaining[numeric_columns].where(means.isna(), 0)
+        
+        other_columns = columns_with_missing.difference(numeric_columns, sort=False)
+        categorical_columns = [col for col in other_columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+        plain_columns = other_columns.difference(categorical_columns, sort=False)
+        fill_values.update(dict.fromkeys(plain_columns, 'Unknown'))
+        
+        # One fillna over the frame: with copy-on-write, columns that need no
+        # filling are shared with the input rather than copied
+        if fill_values:
+            df = df.fillna(fill_values)
+        for column in categorical_columns:
+            df[column] = self._fill_unknown(df[column])
+        remaining[other_columns] = 0
+        
+        missing_after = int(remaining.sum())
         
         self.log_transformation(
             "Missing Value Handling",
@@ -140,6 +213,37 @@ class DataTransformer:
         
         return df
     
+    @staticmethod
+    def _is_fillable_numeric(series: pd.Series) -> bool:
+        """
+        Check whether a column should be mean-filled rather than filled with 'Unknown'.
+        
+        Args:
+            series (pd.Series): Column to check
+        
+        Returns:
+            bool: True for numeric columns of any width (booleans excluded)
+        """
+        return is_numeric_dtype(series.dtype) and not is_bool_dtype(series.dtype)
+    
+    def _fill_unknown(self, series: pd.Series) -> pd.Series:
+        """
+        Fill missing values in a non-numeric column with 'Unknown'.
+        
+        Args:
+            series (pd.Series): Column to fill
+        
+        Returns:
+            pd.Series: Column with missing values replaced
+        """
+        # Categoricals only accept values that are already one of their categories
+        if isinstance(series.dtype, pd.CategoricalDtype) and 'Unknown' not in series.cat.categories:
+            if not series.hasnans:
+                return series
+            series = series.cat.add_categories('Unknown')
+        
+        return series.fillna('Unknown')
+    
     def remove_duplicates(self, 
                          df: pd.DataFrame, 
                          subset: Optional[List[str]] = None,
@@ -171,13 +275,18 @@ class DataTransformer:
     
     def convert_data_types(self, 
                           df: pd.DataFrame, 
-                          type_mapping: Dict[str, str] = None) -> pd.DataFrame:
+                          type_mapping: Dict[str, str] = None,
+                          downcast: bool = False) -> pd.DataFrame:
         """
         Convert data types of columns.
         
         Args:
             df (pd.DataFrame): Input DataFrame
             type_mapping (Dict): Mapping of column names to desired data types
+            downcast (bool): Shrink numeric columns to the smallest dtype that holds
+                their values (integers losslessly, floats only when float32 is exact
+                enough). Narrow integers can overflow in later arithmetic, so this
+                is opt-in.
         
         Returns:
             pd.DataFrame: DataFrame with converted data types
@@ -192,6 +301,12 @@ class DataTransformer:
                 try:
                     original_type = df[column].dtype
                     
+                    # Columns that already have the target type are left untouched
+                    if ((target_type == 'numeric' and is_numeric_dtype(original_type)) or
+                            (target_type == 'datetime' and is_datetime64_any_dtype(original_type)) or
+                            (target_type == 'category' and isinstance(original_type, pd.CategoricalDtype))):
+                        continue
+                    
                     if target_type == 'datetime':
                         df[column] = pd.to_datetime(df[column], errors='coerce')
                     elif target_type == 'numeric':
@@ -212,6 +327,82 @@ class DataTransformer:
                 f"Converted {len(conversions_made)} columns: {'; '.join(conversions_made)}"
             )
         
+        if downcast:
+            df = self._downcast_numeric(df)
+        
+        return df
+    
+    def _downcast_numeric(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast numeric columns to the narrowest dtype that holds their values.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame
+        
+        Returns:
+            pd.DataFrame: DataFrame with downcast numeric columns
+        """
+        numeric_columns = [col for col in df.columns if self._is_fillable_numeric(df[col])]
+        if not numeric_columns:
+            return df
+        
+        bytes_before = df[numeric_columns].memory_usage(index=False).sum()
+        for column in numeric_columns:
+            kind = 'integer' if is_integer_dtype(df[column].dtype) else 'float'
+            df[column] = pd.to_numeric(df[column], downcast=kind)
+        bytes_after = df[numeric_columns].memory_usage(index=False).sum()
+        
+        self.log_transformation(
+            "Numeric Downcast",
+            f"Downcast {len(numeric_columns)} numeric columns from {bytes_before} to {bytes_after} bytes"
+        )
+        
+        return df
+    
+    def _auto_categorize(self, 
+                         df: pd.DataFrame, 
+                         max_cardinality_ratio: float = 0.5,
+                         exclude: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Convert low-cardinality string columns to the category dtype.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            max_cardinality_ratio (float): Maximum ratio of distinct values to rows
+                for conversion, ignoring nulls and the most frequent value
+            exclude (List[str], optional): Columns to leave untouched
+        
+        Returns:
+            pd.DataFrame: DataFrame with low-cardinality strings as categories
+        """
+        if len(df) == 0:
+            return df
+        
+        excluded = set(exclude or [])
+        categorized = []
+        
+        for column in df.select_dtypes(include=['object', 'string']).columns:
+            if column in excluded:
+                continue
+            # Mixed-type object columns stay as they are: their categories would
+            # mix types too, which Arrow-based writers cannot store
+            if pd.api.types.infer_dtype(df[column], skipna=True) != 'string':
+                continue
+            # Nulls and the most frequent value are left out of the ratio. In a
+            # combined multi-source frame that value is usually a fill value
+            # ('Unknown') for rows from other sources, which would otherwise make
+            # sparse identifier columns look repetitive.
+            rest = df[column].value_counts().iloc[1:]
+            if rest.empty or len(rest) / rest.sum() < max_cardinality_ratio:
+                df[column] = df[column].astype('category')
+                categorized.append(column)
+        
+        if categorized:
+            self.log_transformation(
+                "Automatic Categorization",
+                f"Converted {len(categorized)} columns to category: {', '.join(categorized)}"
+            )
+        
         return df
     
     def create_calculated_fields(self, 
@@ -232,15 +423,31 @@ class DataTransformer:
         
         fields_created = []
         
+        # New columns are collected and attached in one concat instead of one
+        # block insertion per field; a formula that reads a pending field (or
+        # cannot be inspected) attaches the pending ones first
+        new_fields = {}
+        
         for new_column, formula in calculations.items():
             try:
-                # Use eval with DataFrame context (be careful with security in production)
-                df[new_column] = df.eval(formula)
+                referenced = self._referenced_names(formula)
+                if new_fields and (referenced is None or referenced & new_fields.keys()):
+                    df = pd.concat([df, pd.DataFrame(new_fields, index=df.index)], axis=1)
+                    new_fields = {}
+                
+                result = self._evaluate_formula(df, formula)
+                if new_column in df.columns:
+                    df[new_column] = result
+                else:
+                    new_fields[new_column] = result
                 fields_created.append(f"{new_column} = {formula}")
                 
             except Exception as e:
                 self.logger.warning(f"Failed to create calculated field {new_column}: {str(e)}")
         
+        if new_fields:
+            df = pd.concat([df, pd.DataFrame(new_fields, index=df.index)], axis=1)
+        
         if fields_created:
             self.log_transformation(
                 "Calculated Fields Creation",
@@ -249,6 +456,22 @@ class DataTransformer:
         
         return df
     
+    def _evaluate_formula(self, df: pd.DataFrame, formula: str) -> Any:
+        """
+        Evaluate a formula against the DataFrame's columns.
+        
+        Simple arithmetic/comparison formulas reuse a cached compiled expression
+        over the column Series; anything else goes through DataFrame.eval.
+        
+        Args:
+            df (pd.DataFrame): DataFrame providing the column values
+            formula (str): Formula to evaluate
+        
+        Returns:
+            Any: Result of the formula, usually a Series
+        """
+        return evaluate_formula(df, formula)
+    
     def aggregate_data(self, 
                       df: pd.DataFrame, 
                       group_by: List[str], 
@@ -265,12 +488,26 @@ class DataTransformer:
             pd.DataFrame: Aggregated DataFrame
         """
         try:
-            # Perform aggregation
-            agg_df = df.groupby(group_by).agg(aggregations).reset_index()
+            # observed=True skips empty category combinations now that repeated
+            # strings are categoricals; group keys stay sorted for stable reports
+            grouped = df.groupby(group_by, sort=True, observed=True, as_index=False)
             
-            # Flatten column names if multi-level
-            if isinstance(agg_df.columns, pd.MultiIndex):
-                agg_df.columns = ['_'.join(col).strip('_') for col in agg_df.columns.values]
+            funcs = set(aggregations.values()) if all(isinstance(f, str) for f in aggregations.values()) else set()
+            if len(funcs) == 1 and hasattr(grouped, next(iter(funcs))):
+                # One named reduction for every column: call it directly and skip
+                # the dict aggregation planner
+                agg_df = getattr(grouped[list(aggregations)], next(iter(funcs)))()
+            else:
+                # Named aggregations give flat output names directly. Columns keep
+                # their name unless any entry is a list, in which case every output
+                # is named <column>_<func>
+                suffixed = any(isinstance(f, list) for f in aggregations.values())
+                named = {}
+                for column, funcs_for_column in aggregations.items():
+                    for func in (funcs_for_column if isinstance(funcs_for_column, list) else [funcs_for_column]):
+                        func_name = func if isinstance(func, str) else func.__name__
+                        named[f"{column}_{func_name}" if suffixed else column] = (column, func)
+                agg_df = grouped.agg(**named)
             
             self.log_transformation(
                 "Data Aggregation",
@@ -308,7 +545,7 @@ class DataTransformer:
                     # Simple calculation based on formula
                     formula = config.get('formula', '')
                     if formula:
-                        df[kpi_name] = df.eval(formula)
+                        df[kpi_name] = self._evaluate_formula(df, formula)
                         kpis_calculated.append(kpi_name)
                 
                 elif kpi_type == 'growth':
@@ -317,8 +554,15 @@ class DataTransformer:
                     period_column = config.get('period_column', '')
                     
                     if base_column and period_column:
-                        df = df.sort_values(period_column)
-                        df[kpi_name] = df[base_column].pct_change() * 100
+                        df = df.sort_values(period_column, kind='stable')
+                        values = df[base_column].to_numpy(dtype=np.float64, na_value=np.nan)
+                        growth = np.empty_like(values)
+                        growth[:1] = np.nan
+                        with np.errstate(divide='ignore', invalid='ignore'):
+                            np.divide(values[1:], values[:-1], out=growth[1:])
+                        growth[1:] -= 1.0
+                        growth *= 100
+                        df[kpi_name] = growth
                         kpis_calculated.append(kpi_name)
                 
                 elif kpi_type == 'ratio':
@@ -334,7 +578,16 @@ class DataTransformer:
                     # Cumulative sum
                     base_column = config.get('base_column', '')
                     if base_column:
-                        df[kpi_name] = df[base_column].cumsum()
+                        values = df[base_column].to_numpy()
+                        if values.dtype.kind in 'iu':
+                            df[kpi_name] = np.cumsum(values)
+                        elif values.dtype.kind == 'f':
+                            # Match Series.cumsum: gaps stay NaN without breaking the running total
+                            totals = np.nancumsum(values)
+                            totals[np.isnan(values)] = np.nan
+                            df[kpi_name] = totals
+                        else:
+                            df[kpi_name] = df[base_column].cumsum()
                         kpis_calculated.append(kpi_name)
                 
             except Exception as e:
@@ -385,6 +638,12 @@ class DataTransformer:
         
         rules_applied = []
         
+        # Consecutive set_ rules are batched so each target column is written once.
+        # A batch is flushed before any rule whose condition reads a column the
+        # batch writes (or cannot be inspected), and before every drop rule.
+        pending_sets = []
+        pending_targets = set()
+        
         for rule in rules:
             try:
                 rule_name = rule.get('name', 'Unnamed Rule')
@@ -392,13 +651,24 @@ class DataTransformer:
                 action = rule.get('action', '')
                 
                 if condition and action:
-                    # Apply the rule
-                    mask = df.eval(condition)
+                    referenced = self._referenced_names(condition)
+                    if pending_sets and (referenced is None or referenced & pending_targets):
+                        df = self._apply_set_rules(df, pending_sets, rules_applied)
+                        pending_sets, pending_targets = [], set()
+                    
+                    # Apply the rule (compiled once per condition text)
+                    mask = self._evaluate_formula(df, condition)
                     if action.startswith('set_'):
                         # Set column value
                         column, value = action.replace('set_', '').split('=')
-                        df.loc[mask, column.strip()] = value.strip()
-                    elif action.startswith('drop'):
+                        pending_sets.append((rule_name, mask, column.strip(), value.strip()))
+                        pending_targets.add(column.strip())
+                        continue
+                    
+                    if pending_sets:
+                        df = self._apply_set_rules(df, pending_sets, rules_applied)
+                        pending_sets, pending_targets = [], set()
+                    if action.startswith('drop'):
                         # Drop rows
                         df = df[~mask]
                     
@@ -407,6 +677,9 @@ class DataTransformer:
             except Exception as e:
                 self.logger.warning(f"Failed to apply business rule {rule.get('name', 'Unknown')}: {str(e)}")
         
+        if pending_sets:
+            df = self._apply_set_rules(df, pending_sets, rules_applied)
+        
         if rules_applied:
             self.log_transformation(
                 "Business Rules Application",
@@ -415,6 +688,61 @@ class DataTransformer:
         
         return df
     
+    @staticmethod
+    def _referenced_names(condition: str) -> Optional[set]:
+        """
+        Collect the names a rule condition or formula reads.
+        
+        Args:
+            condition (str): Expression in DataFrame.eval syntax
+        
+        Returns:
+            Optional[set]: Referenced names, or None if the expression is not plain Python syntax
+        """
+        try:
+            tree = ast.parse(condition, mode='eval')
+        except SyntaxError:
+            return None
+        
+        return {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    
+    def _apply_set_rules(self, 
+                         df: pd.DataFrame, 
+                         pending_sets: List[tuple], 
+                         rules_applied: List[str]) -> pd.DataFrame:
+        """
+        Write a batch of set_ rules with a single assignment per target column.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame
+            pending_sets (List[tuple]): (rule name, mask, column, value) in rule order
+            rules_applied (List[str]): Names of successfully applied rules, extended in place
+        
+        Returns:
+            pd.DataFrame: DataFrame with the batch applied
+        """
+        for column in dict.fromkeys(target for _, _, target, _ in pending_sets):
+            group = [(name, mask, value) for name, mask, target, value in pending_sets if target == column]
+            try:
+                if len(group) == 1:
+                    _, mask, value = group[0]
+                    df.loc[mask, column] = value
+                else:
+                    # np.select takes the first match, so reverse to keep "last rule wins"
+                    masks = [np.broadcast_to(np.asarray(mask, dtype=bool), (len(df),)) for _, mask, _ in reversed(group)]
+                    values = np.array([value for _, _, value in reversed(group)], dtype=object)
+                    choice = np.select(masks, np.arange(len(group)), default=-1)
+                    hit = choice >= 0
+                    df.loc[hit, column] = values[choice[hit]]
+                
+                rules_applied.extend(name for name, _, _ in group)
+                
+            except Exception as e:
+                for name, _, _ in group:
+                    self.logger.warning(f"Failed to apply business rule {name}: {str(e)}")
+        
+        return df
+    
     def transform_data(self, 
                       df: pd.DataFrame, 
                       config: Dict = None) -> pd.DataFrame:
@@ -438,33 +766,69 @@ class DataTransformer:
         if config.get('standardize_columns', True):
             df = self.standardize_column_names(df)
         
-        # Step 2: Handle missing values
+        # Step 1b: Move Python-object string columns onto Arrow string storage
+        if config.get('use_arrow_strings', False):
+            df = self._to_arrow_strings(df)
+        
+        # Steps 2-3: Handle missing values and remove duplicates. By default
+        # duplicates go first so fills are not computed for rows about to be
+        # dropped (fill means then reflect the deduplicated data).
+        dedup_first = config.get('dedup_first', True)
+        if dedup_first and config.get('remove_duplicates', True):
+            df = self.remove_duplicates(df, config.get('duplicate_subset', None))
+        
         if config.get('handle_missing', True):
             missing_strategy = config.get('missing_strategy', {})
             df = self.handle_missing_values(df, missing_strategy)
         
-        # Step 3: Remove duplicates
-        if config.get('remove_duplicates', True):
-            duplicate_subset = config.get('duplicate_subset', None)
-            df = self.remove_duplicates(df, duplicate_subset)
+        if not dedup_first and config.get('remove_duplicates', True):
+            df = self.remove_duplicates(df, config.get('duplicate_subset', None))
         
         # Step 4: Convert data types
         if config.get('convert_types', True):
             type_mapping = config.get('type_mapping', {})
-            df = self.convert_data_types(df, type_mapping)
+            df = self.convert_data_types(df, type_mapping, config.get('type_mapping_downcast', False))
         
-        # Step 5: Create calculated fields
-        calculations = config.get('calculations', {})
-        if calculations:
-            df = self.create_calculated_fields(df, calculations)
-        
-        # Step 6: Apply business rules
+        # Step 4b (opt-in): Store repeated strings as categories for faster
+        # eval/groupby. Columns that calculated fields read (string concatenation
+        # fails on categoricals), business rules write to or KPIs divide keep
+        # their dtype.
         business_rules = config.get('business_rules', [])
-        if business_rules:
-            df = self.apply_business_rules(df, business_rules)
+        kpi_config = config.get('kpi_config', {})
+        if config.get('auto_categorize', False):
+            protected_columns = [
+                name for formula in config.get('calculations', {}).values()
+                for name in _RE_IDENTIFIER.findall(formula)
+            ]
+            protected_columns += [
+                rule.get('action', '')[len('set_'):].split('=')[0].strip()
+                for rule in business_rules
+                if rule.get('action', '').startswith('set_')
+            ]
+            protected_columns += [
+                kpi.get(key) for kpi in kpi_config.values()
+                for key in ('numerator', 'denominator') if kpi.get(key)
+            ]
+            df = self._auto_categorize(
+                df,
+                config.get('category_max_ratio', 0.5),
+                exclude=protected_columns
+            )
+        
+        # Steps 5-6: Create calculated fields and apply business rules. Both are
+        # row-local, so a configured chunksize runs them one row slice at a time
+        # to bound the size of their intermediate results.
+        calculations = config.get('calculations', {})
+        chunksize = config.get('chunksize')
+        if chunksize and len(df) > chunksize:
+            df = pd.concat([
+                self._apply_row_steps(df.iloc[start:start + chunksize], calculations, business_rules)
+                for start in range(0, len(df), chunksize)
+            ])
+        else:
+            df = self._apply_row_steps(df, calculations, business_rules)
         
         # Step 7: Calculate KPIs
-        kpi_config = config.get('kpi_config', {})
         if kpi_config:
             df = self.calculate_kpis(df, kpi_config)
         
@@ -475,6 +839,29 @@ class DataTransformer:
         
         return df
     
+    def _apply_row_steps(self, 
+                         df: pd.DataFrame, 
+                         calculations: Dict[str, str], 
+                         business_rules: List[Dict]) -> pd.DataFrame:
+        """
+        Run the row-local pipeline steps: calculated fields, then business rules.
+        
+        Args:
+            df (pd.DataFrame): Input DataFrame or row chunk
+            calculations (Dict[str, str]): Calculated field formulas
+            business_rules (List[Dict]): Business rules to apply
+        
+        Returns:
+            pd.DataFrame: DataFrame with calculated fields and rules applied
+        """
+        if calculations:
+            df = self.create_calculated_fields(df, calculations)
+        
+        if business_rules:
+            df = self.apply_business_rules(df, business_rules)
+        
+        return df
+    
     def get_transformation_summary(self) -> pd.DataFrame:
         """
         Get a summary of all transformations applied.
@@ -485,7 +872,11 @@ class DataTransformer:
         if not self.transformation_log:
             return pd.DataFrame()
         
-        summary_df = pd.DataFrame(self.transformation_log)
+        # The entries share fixed keys, so build the columns directly instead of
+        # letting the DataFrame constructor infer them from each dict
+        summary_df = pd.DataFrame.from_records(
+            self.transformation_log, columns=['timestamp', 'operation', 'details']
+        )
         return summary_df
 
 
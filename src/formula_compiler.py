@@ -0,0 +1,117 @@
+"""
+Formula Compilation Module for Automated Reporting ETL Pipeline
+
+This module compiles the simple column formulas used by transformations and
+custom KPIs into cached code objects. Formulas that Python would not evaluate
+exactly like DataFrame.eval are left to DataFrame.eval.
+"""
+
+import ast
+import pandas as pd
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Optional, Tuple
+
+
+# AST nodes a formula may use to skip DataFrame.eval: plain column arithmetic,
+# single comparisons and &/|/~ masks, which evaluate identically on Series in
+# Python (see compile_formula for the one &/| precedence difference)
+_SIMPLE_FORMULA_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Compare, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.USub, ast.UAdd,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+    ast.BitAnd, ast.BitOr, ast.Invert,
+)
+
+# Series reductions a KPI formula may call as column.method() with no arguments
+KPI_REDUCTIONS = frozenset({
+    'sum', 'mean', 'median', 'min', 'max', 'count', 'nunique', 'std', 'var'
+})
+
+
+def _reduction_nodes(tree: ast.AST) -> set:
+    """
+    Find the column.reduction() calls in a parsed formula.
+    
+    Args:
+        tree (ast.AST): Parsed formula
+    
+    Returns:
+        set: The Call nodes and their Attribute nodes, for every call of an
+            allowed reduction directly on a column name without arguments
+    """
+    nodes = set()
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Call) and not node.args and not node.keywords
+                and isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name)
+                and node.func.attr in KPI_REDUCTIONS):
+            nodes.update((node, node.func))
+    return nodes
+
+
+@lru_cache(maxsize=256)
+def compile_formula(formula: str,
+                    allow_reductions: bool = False) -> Optional[Tuple[CodeType, Tuple[str, ...]]]:
+    """
+    Compile a simple column formula once, keyed by its text.
+    
+    Args:
+        formula (str): Formula such as 'sales_amount / quantity'
+        allow_reductions (bool): Also accept column.reduction() calls from
+            KPI_REDUCTIONS, e.g. 'total_amount.sum() / quantity.sum()'
+    
+    Returns:
+        Optional[Tuple[CodeType, Tuple[str, ...]]]: Compiled expression and the
+            column names it reads, or None if the formula needs DataFrame.eval
+            (boolean logic, chained comparisons, backticks, other calls, ...)
+    """
+    try:
+        tree = ast.parse(formula, mode='eval')
+    except SyntaxError:
+        return None
+    
+    reductions = _reduction_nodes(tree) if allow_reductions else set()
+    
+    for node in ast.walk(tree):
+        if node in reductions:
+            continue
+        if not isinstance(node, _SIMPLE_FORMULA_NODES):
+            return None
+        if isinstance(node, ast.Compare):
+            if len(node.ops) > 1:
+                return None
+            # Python binds & and | tighter than comparisons, DataFrame.eval looser
+            # (like and/or), so 'x > 1 & flag' only means the same when the mask
+            # was parenthesised, which the AST no longer shows
+            for operand in [node.left, *node.comparators]:
+                if any(isinstance(sub, ast.BinOp) and isinstance(sub.op, (ast.BitAnd, ast.BitOr))
+                       for sub in ast.walk(operand)):
+                    return None
+    
+    columns = tuple(dict.fromkeys(node.id for node in ast.walk(tree) if isinstance(node, ast.Name)))
+    return compile(tree, '<formula>', 'eval'), columns
+
+
+def evaluate_formula(df: pd.DataFrame, formula: str, allow_reductions: bool = False) -> Any:
+    """
+    Evaluate a formula against a DataFrame's columns.
+    
+    Formulas accepted by compile_formula reuse the cached code object over the
+    column Series; anything else goes through DataFrame.eval.
+    
+    Args:
+        df (pd.DataFrame): DataFrame providing the column values
+        formula (str): Formula to evaluate
+        allow_reductions (bool): Passed on to compile_formula
+    
+    Returns:
+        Any: Result of the formula, a Series or a scalar
+    """
+    compiled = compile_formula(formula, allow_reductions)
+    if compiled is None or not all(name in df.columns for name in compiled[1]):
+        # Use eval with DataFrame context (be careful with security in production)
+        return df.eval(formula)
+    
+    code, names = compiled
+    return eval(code, {'__builtins__': {}}, {name: df[name] for name in names})
@@ -6,16 +6,51 @@ high-level interfaces for report generation and automation.
 """
 
 import pandas as pd
+import numpy as np
 import logging
-from typing import Dict, List, Optional, Union, Any
+from logging.handlers import QueueHandler, QueueListener
+from pandas.api.types import is_bool_dtype, is_datetime64_any_dtype, is_numeric_dtype
+from typing import TYPE_CHECKING, Dict, List, Optional, Union, Any
 from pathlib import Path
 from datetime import datetime
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import copy
+import hashlib
+import importlib.util
 import json
-import yaml
+import os
+import queue
+import threading
 
-from data_extractor import DataExtractor
-from data_transformer import DataTransformer
-from data_loader import DataLoader
+# yaml and the ETL component modules (which pull in openpyxl, pyarrow and
+# matplotlib) are imported on first use, so building a ReportGenerator to read
+# or save config stays cheap
+if TYPE_CHECKING:
+    from data_extractor import DataExtractor
+    from data_transformer import DataTransformer
+    from data_loader import DataLoader
+
+
+# Parsed config files keyed by (path, mtime_ns, size, inode). Callers always get
+# a deep copy because the pipeline phases update their config sections in place.
+_CONFIG_CACHE: Dict[tuple, Dict] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# YAML text written by save_config, keyed by a hash of the config's JSON form.
+# JSON configs are not cached: hashing them costs as much as writing them.
+_YAML_CONFIG_CACHE: Dict[str, str] = {}
+_YAML_CONFIG_CACHE_SIZE = 32
+
+# Parquet output needs pyarrow
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# Default report formats: Parquet replaces CSV when pyarrow is installed
+DEFAULT_REPORT_FORMATS = ['parquet' if PARQUET_AVAILABLE else 'csv', 'excel_styled', 'summary']
+
+# Above this many rows a requested CSV report is written as Parquet instead
+CSV_ROW_THRESHOLD = 100_000
 
 
 class ReportGenerator:
@@ -44,22 +79,31 @@ class ReportGenerator:
         # Create output directory if it doesn't exist
         self.output_directory.mkdir(parents=True, exist_ok=True)
         
-        # Set up logging
-        log_file = self.output_directory / f"etl_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        logging.basicConfig(
-            level=getattr(logging, log_level.upper()),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
-        )
+        # Timestamp shared by this run's log file and default report name
+        self._run_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        # Set up logging. Like basicConfig, this only configures a root logger
+        # without handlers; records are queued and written to the log file and
+        # console by a background listener so logging calls never block on I/O.
+        root_logger = logging.getLogger()
+        if not root_logger.handlers:
+            log_file = self.output_directory / f"etl_log_{self._run_ts}.log"
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            output_handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+            for handler in output_handlers:
+                handler.setFormatter(formatter)
+            
+            log_queue = queue.Queue(-1)
+            listener = QueueListener(log_queue, *output_handlers)
+            listener.start()
+            atexit.register(listener.stop)
+            
+            root_logger.addHandler(QueueHandler(log_queue))
+            root_logger.setLevel(getattr(logging, log_level.upper()))
         self.logger = logging.getLogger(__name__)
         
-        # Initialize ETL components
-        self.extractor = DataExtractor(str(self.input_directory), log_level)
-        self.transformer = DataTransformer(log_level)
-        self.loader = DataLoader(str(self.output_directory), log_level)
+        # ETL components are created on first access
+        self.log_level = log_level
         
         # Load configuration
         self.config = self._load_config()
@@ -69,6 +113,39 @@ class ReportGenerator:
         
         self.logger.info("ReportGenerator initialized successfully")
     
+    @cached_property
+    def extractor(self) -> 'DataExtractor':
+        """
+        Data extractor for the input directory, created on first use.
+        
+        Returns:
+            DataExtractor: Extractor instance
+        """
+        from data_extractor import DataExtractor
+        return DataExtractor(str(self.input_directory), self.log_level)
+    
+    @cached_property
+    def transformer(self) -> 'DataTransformer':
+        """
+        Data transformer, created on first use.
+        
+        Returns:
+            DataTransformer: Transformer instance
+        """
+        from data_transformer import DataTransformer
+        return DataTransformer(self.log_level)
+    
+    @cached_property
+    def loader(self) -> 'DataLoader':
+        """
+        Data loader for the output directory, created on first use.
+        
+        Returns:
+            DataLoader: Loader instance
+        """
+        from data_loader import DataLoader
+        return DataLoader(str(self.output_directory), self.log_level)
+    
     def _load_config(self) -> Dict:
         """
         Load configuration from file or return default configuration.
@@ -78,11 +155,29 @@ class ReportGenerator:
         """
         if self.config_file and Path(self.config_file).exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    if self.config_file.endswith('.yaml') or self.config_file.endswith('.yml'):
-                        config = yaml.safe_load(f)
-                    else:
-                        config = json.load(f)
+                config_path = os.path.abspath(self.config_file)
+                stat = os.stat(config_path)
+                cache_key = (config_path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+                
+                with _CONFIG_CACHE_LOCK:
+                    cached = _CONFIG_CACHE.get(cache_key)
+                
+                if cached is not None:
+                    config = copy.deepcopy(cached)
+                else:
+                    with open(self.config_file, 'r') as f:
+                        if self.config_file.endswith('.yaml') or self.config_file.endswith('.yml'):
+                            import yaml
+                            # Use the libyaml C loader when PyYAML was built with it
+                            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+                        else:
+                            config = json.load(f)
+                    
+                    with _CONFIG_CACHE_LOCK:
+                        # Forget older versions of the same file
+                        for key in [key for key in _CONFIG_CACHE if key[0] == config_path]:
+                            del _CONFIG_CACHE[key]
+                        _CONFIG_CACHE[cache_key] = copy.deepcopy(config)
                 
                 self.logger.info(f"Loaded configuration from {self.config_file}")
                 return config
@@ -102,8 +197,10 @@ class ReportGenerator:
         """
         return {
             'extraction': {
-                'file_patterns': ['*.xlsx', '*.xls', '*.csv'],
-                'add_source_column': True
+                'file_patterns': ['*.xlsx', '*.xls', '*.csv', '*.parquet', '*.feather'],
+                'add_source_column': True,
+                'dtype_map': {},
+                'parse_dates': []
             },
             'transformation': {
                 'standardize_columns': True,
@@ -116,15 +213,16 @@ class ReportGenerator:
                 'kpi_config': {}
             },
             'loading': {
-                'formats': ['csv', 'excel_styled', 'summary'],
+                'formats': list(DEFAULT_REPORT_FORMATS),
                 'create_visualizations': True,
                 'summary_config': {
                     'custom_kpis': {}
                 }
             },
             'reporting': {
-                'base_filename': f"automated_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                'base_filename': f"automated_report_{self._run_ts}",
                 'include_metadata': True,
+                'metadata_format': 'json',
                 'create_dashboard': False
             }
         }
@@ -147,13 +245,17 @@ class ReportGenerator:
         # Extract data
         raw_data = self.extractor.extract_data(
             file_patterns=extraction_config.get('file_patterns'),
-            add_source_column=extraction_config.get('add_source_column', True)
+            add_source_column=extraction_config.get('add_source_column', True),
+            low_cardinality_cols=extraction_config.get('low_cardinality_cols'),
+            dtype_map=extraction_config.get('dtype_map'),
+            parse_dates=extraction_config.get('parse_dates')
         )
         
         # Store results
         self.pipeline_results['extraction'] = {
             'data_shape': raw_data.shape,
             'columns': list(raw_data.columns),
+            'file_count': self.extractor.last_file_count,
             'extraction_time': datetime.now()
         }
         
@@ -209,18 +311,35 @@ class ReportGenerator:
         reporting_config = self.config.get('reporting', {})
         base_filename = reporting_config.get('base_filename', 'automated_report')
         
-        # Create reports in multiple formats
-        output_files = self.loader.create_multi_format_report(
-            data,
-            base_filename,
-            formats=loading_config.get('formats', ['csv', 'excel_styled', 'summary']),
-            config=loading_config.get('summary_config', {})
-        )
-        
-        # Create visualizations if requested
-        if loading_config.get('create_visualizations', True):
-            visualizations = self._create_visualizations(data, base_filename)
-            output_files.update(visualizations)
+        formats = loading_config.get('formats', DEFAULT_REPORT_FORMATS)
+        if PARQUET_AVAILABLE and 'csv' in formats and len(data) > CSV_ROW_THRESHOLD:
+            self.logger.warning(
+                f"CSV report skipped for {len(data)} rows (threshold {CSV_ROW_THRESHOLD}); "
+                f"writing Parquet instead"
+            )
+            formats = [f for f in formats if f != 'csv']
+            if 'parquet' not in formats:
+                formats.append('parquet')
+        
+        # Charts are drawn on a worker thread while the reports are written here.
+        # Charts run one after another because the loader reuses a single figure;
+        # the loader itself is created before the worker starts.
+        loader = self.loader
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            visualizations = None
+            if loading_config.get('create_visualizations', True):
+                visualizations = executor.submit(self._create_visualizations, data, base_filename)
+            
+            # Create reports in multiple formats
+            output_files = loader.create_multi_format_report(
+                data,
+                base_filename,
+                formats=formats,
+                config=loading_config.get('summary_config', {})
+            )
+            
+            if visualizations is not None:
+                output_files.update(visualizations.result())
         
         # Store results
         self.pipeline_results['loading'] = {
@@ -245,13 +364,17 @@ class ReportGenerator:
         visualizations = {}
         
         try:
-            # Get numeric and categorical columns
-            numeric_cols = data.select_dtypes(include=['number']).columns.tolist()
-            categorical_cols = data.select_dtypes(include=['object', 'category']).columns.tolist()
-            
-            # Remove metadata columns
-            categorical_cols = [col for col in categorical_cols 
-                              if col not in ['source_file', 'source_path']]
+            # Bucket numeric, categorical and date columns in one pass over the dtypes
+            numeric_cols, categorical_cols, date_cols = [], [], []
+            for col, dtype in data.dtypes.items():
+                if is_numeric_dtype(dtype) and not is_bool_dtype(dtype):
+                    numeric_cols.append(col)
+                elif dtype == object or isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype)):
+                    # Skip metadata columns
+                    if col not in ['source_file', 'source_path']:
+                        categorical_cols.append(col)
+                elif is_datetime64_any_dtype(dtype):
+                    date_cols.append(col)
             
             # Create bar chart if we have categorical and numeric data
             if len(categorical_cols) > 0 and len(numeric_cols) > 0:
@@ -259,10 +382,19 @@ class ReportGenerator:
                 cat_col = categorical_cols[0]
                 num_col = numeric_cols[0]
                 
-                # Limit to top 10 categories to avoid cluttered charts
-                top_categories = data[cat_col].value_counts().head(10).index
-                viz_data = data[data[cat_col].isin(top_categories)]
-                agg_data = viz_data.groupby(cat_col)[num_col].sum().reset_index()
+                # Limit to top 10 categories to avoid cluttered charts. Counts and
+                # sums come from the same sorted integer codes, so the top codes are
+                # picked with argpartition and no rows need to be filtered out.
+                codes, categories = pd.factorize(data[cat_col], sort=True)
+                valid = codes >= 0
+                counts = np.bincount(codes[valid], minlength=len(categories))
+                top_n = min(10, counts.size)
+                top_codes = np.sort(np.argpartition(counts, counts.size - top_n)[counts.size - top_n:])
+                
+                values = data[num_col].to_numpy(dtype=np.float64, na_value=np.nan)
+                summable = valid & ~np.isnan(values)
+                totals = np.bincount(codes[summable], weights=values[summable], minlength=len(categories))
+                agg_data = pd.DataFrame({cat_col: categories[top_codes], num_col: totals[top_codes]})
                 
                 viz_path = self.loader.create_visualization(
                     agg_data,
@@ -285,14 +417,13 @@ class ReportGenerator:
                 visualizations['heatmap'] = viz_path
             
             # Create time series if we have date columns
-            date_cols = data.select_dtypes(include=['datetime64']).columns.tolist()
             if len(date_cols) > 0 and len(numeric_cols) > 0:
                 date_col = date_cols[0]
                 num_col = numeric_cols[0]
                 
-                # Aggregate by date
-                time_data = data.groupby(data[date_col].dt.date)[num_col].sum().reset_index()
-                time_data.columns = [date_col, num_col]
+                # Aggregate by calendar day (normalize stays vectorized, unlike .dt.date)
+                days, totals = self._fast_group_sum(data[date_col].dt.normalize(), data[num_col])
+                time_data = pd.DataFrame({date_col: days, num_col: totals})
                 
                 viz_path = self.loader.create_visualization(
                     time_data,
@@ -309,6 +440,28 @@ class ReportGenerator:
         
         return visualizations
     
+    @staticmethod
+    def _fast_group_sum(keys: pd.Series, values: pd.Series) -> tuple:
+        """
+        Sum values per key in one pass with np.bincount.
+        
+        Matches groupby(keys).sum(): keys come back sorted, missing keys are
+        dropped and missing values count as zero.
+        
+        Args:
+            keys (pd.Series): Group keys
+            values (pd.Series): Numeric values to sum
+        
+        Returns:
+            tuple: (unique keys, float64 array of sums)
+        """
+        codes, uniques = pd.factorize(keys, sort=True)
+        weights = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        
+        valid = (codes >= 0) & ~np.isnan(weights)
+        sums = np.bincount(codes[valid], weights=weights[valid], minlength=len(uniques))
+        return uniques, sums
+    
     def run_complete_pipeline(self, **kwargs) -> Dict[str, Any]:
         """
         Run the complete ETL pipeline from extraction to loading.
@@ -355,7 +508,7 @@ class ReportGenerator:
                 'status': 'success',
                 'pipeline_duration_seconds': pipeline_duration,
                 'data_summary': {
-                    'input_files_processed': len(self.extractor.discover_files()),
+                    'input_files_processed': self.pipeline_results['extraction']['file_count'],
                     'total_rows_processed': len(transformed_data),
                     'total_columns': len(transformed_data.columns),
                     'output_files_generated': len(output_files)
@@ -375,6 +528,130 @@ class ReportGenerator:
                 'pipeline_results': self.pipeline_results
             }
     
+    def run_complete_pipeline_streaming(self, chunk_rows: int = 200_000, **kwargs) -> Dict[str, Any]:
+        """
+        Run the ETL pipeline chunk by chunk, appending each transformed chunk
+        to the output files instead of materializing the full dataset.
+        
+        Each chunk is transformed on its own, so duplicates are only removed
+        and missing-value means only computed within a chunk. Automatic
+        categorization is turned off to keep column types identical across
+        chunks, and all input files must share the same columns. Only the
+        'parquet' and 'csv' formats can be appended to; other requested formats
+        and visualizations are skipped.
+        
+        Args:
+            chunk_rows (int): Maximum number of rows per chunk
+            **kwargs: Additional arguments for any phase
+        
+        Returns:
+            Dict[str, Any]: Pipeline results
+        """
+        self.logger.info("Starting streaming ETL pipeline")
+        pipeline_start_time = datetime.now()
+        
+        extraction_config = self.config.get('extraction', {})
+        extraction_config.update(kwargs.get('extraction', {}))
+        transformation_config = self.config.get('transformation', {})
+        transformation_config.update(kwargs.get('transformation', {}))
+        transformation_config = dict(transformation_config, auto_categorize=False)
+        loading_config = self.config.get('loading', {})
+        loading_config.update(kwargs.get('loading', {}))
+        
+        base_filename = self.config.get('reporting', {}).get('base_filename', 'automated_report')
+        formats = loading_config.get('formats', DEFAULT_REPORT_FORMATS)
+        streamable = [f for f in formats if f == 'csv' or (f == 'parquet' and PARQUET_AVAILABLE)]
+        skipped = [f for f in formats if f not in streamable]
+        if skipped:
+            self.logger.warning(f"Formats not supported in streaming mode were skipped: {', '.join(skipped)}")
+        
+        output_files = {
+            f: str(self.output_directory / f"{base_filename}.{f}") for f in streamable
+        }
+        parquet_writer = None
+        columns = None
+        total_rows = 0
+        chunk_count = 0
+        
+        try:
+            if not streamable:
+                raise ValueError("Streaming mode needs 'csv' or 'parquet' in the output formats")
+            
+            chunks = self.extractor.extract_data_chunks(
+                chunk_rows,
+                file_patterns=extraction_config.get('file_patterns'),
+                add_source_column=extraction_config.get('add_source_column', True)
+            )
+            
+            for chunk in chunks:
+                transformed = self.transformer.transform_data(chunk, transformation_config)
+                
+                if columns is None:
+                    columns = list(transformed.columns)
+                elif list(transformed.columns) != columns:
+                    raise ValueError(
+                        "Streaming mode needs all input files to share the same columns; "
+                        f"got {list(transformed.columns)} after {columns}"
+                    )
+                
+                if 'parquet' in output_files:
+                    import pyarrow as pa
+                    import pyarrow.parquet as pq
+                    
+                    table = pa.Table.from_pandas(transformed, preserve_index=False)
+                    if parquet_writer is None:
+                        parquet_writer = pq.ParquetWriter(output_files['parquet'], table.schema,
+                                                          compression='snappy')
+                    else:
+                        # Later chunks must match the schema of the first one
+                        table = table.cast(parquet_writer.schema)
+                    parquet_writer.write_table(table)
+                
+                if 'csv' in output_files:
+                    transformed.to_csv(output_files['csv'], mode='w' if chunk_count == 0 else 'a',
+                                       header=chunk_count == 0, index=False)
+                
+                total_rows += len(transformed)
+                chunk_count += 1
+            
+            if chunk_count == 0:
+                raise ValueError("No data was extracted. Please check input files.")
+            
+            pipeline_duration = (datetime.now() - pipeline_start_time).total_seconds()
+            
+            self.pipeline_results['streaming'] = {
+                'chunk_rows': chunk_rows,
+                'chunks_processed': chunk_count,
+                'output_files': output_files,
+                'loading_time': datetime.now()
+            }
+            
+            self.logger.info(f"Streaming ETL pipeline completed in {pipeline_duration:.2f} seconds")
+            return {
+                'status': 'success',
+                'pipeline_duration_seconds': pipeline_duration,
+                'data_summary': {
+                    'input_files_processed': self.extractor.last_file_count,
+                    'total_rows_processed': total_rows,
+                    'chunks_processed': chunk_count,
+                    'output_files_generated': len(output_files)
+                },
+                'output_files': output_files,
+                'pipeline_results': self.pipeline_results
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Streaming ETL pipeline failed: {str(e)}")
+            return {
+                'status': 'failed',
+                'error': str(e),
+                'pipeline_results': self.pipeline_results
+            }
+        
+        finally:
+            if parquet_writer is not None:
+                parquet_writer.close()
+    
     def _create_metadata_report(self) -> str:
         """
         Create a metadata report with pipeline information.
@@ -394,26 +671,47 @@ class ReportGenerator:
                 'configuration': self.config
             }
             
+            reporting_config = self.config.get('reporting', {})
+            base_filename = reporting_config.get('base_filename', 'automated_report')
+            
+            # JSON by default: the nested metadata is written as is, without
+            # flattening it into a styled workbook
+            if reporting_config.get('metadata_format', 'json') != 'excel':
+                metadata_file = self.output_directory / f"{base_filename}_metadata.json"
+                with open(metadata_file, 'w') as f:
+                    json.dump(
+                        metadata, f, indent=2,
+                        default=lambda o: o.to_dict(orient='records') if isinstance(o, pd.DataFrame) else str(o)
+                    )
+                
+                self.logger.info(f"Created metadata report: {metadata_file}")
+                return str(metadata_file)
+            
             # Convert to DataFrame for easy viewing
-            metadata_items = []
-            
-            def flatten_dict(d, parent_key='', sep='_'):
-                items = []
-                for k, v in d.items():
-                    new_key = f"{parent_key}{sep}{k}" if parent_key else k
-                    if isinstance(v, dict):
-                        items.extend(flatten_dict(v, new_key, sep=sep).items())
+            def flatten_dict(d, sep='_'):
+                # Iterative depth-first walk; children are pushed in reverse so
+                # items come out in the same order as a recursive traversal
+                flat = {}
+                stack = list(reversed(d.items()))
+                while stack:
+                    key, value = stack.pop()
+                    if isinstance(value, dict):
+                        stack.extend(
+                            (f"{key}{sep}{k}" if key else k, v) for k, v in reversed(value.items())
+                        )
                     else:
-                        items.append((new_key, str(v)))
-                return dict(items)
+                        flat[key] = str(value)
+                return flat
             
             flat_metadata = flatten_dict(metadata)
-            metadata_df = pd.DataFrame(list(flat_metadata.items()), 
-                                     columns=['Metadata_Item', 'Value'])
+            
+            # Build both columns straight from the dict views (no list of row tuples)
+            metadata_df = pd.DataFrame({
+                'Metadata_Item': np.fromiter(flat_metadata.keys(), dtype=object, count=len(flat_metadata)),
+                'Value': np.fromiter(flat_metadata.values(), dtype=object, count=len(flat_metadata))
+            })
             
             # Save as Excel file
-            reporting_config = self.config.get('reporting', {})
-            base_filename = reporting_config.get('base_filename', 'automated_report')
             metadata_file = self.loader.save_to_excel_styled(
                 metadata_df, 
                 f"{base_filename}_metadata.xlsx",
@@ -438,8 +736,19 @@ class ReportGenerator:
             config_path = Path(config_path)
             
             if config_path.suffix.lower() in ['.yaml', '.yml']:
-                with open(config_path, 'w') as f:
-                    yaml.dump(self.config, f, default_flow_style=False)
+                config_hash = hashlib.blake2b(
+                    json.dumps(self.config, sort_keys=True, default=str).encode(), digest_size=16
+                ).hexdigest()
+                
+                serialized = _YAML_CONFIG_CACHE.get(config_hash)
+                if serialized is None:
+                    import yaml
+                    serialized = yaml.dump(self.config, default_flow_style=False)
+                    if len(_YAML_CONFIG_CACHE) >= _YAML_CONFIG_CACHE_SIZE:
+                        _YAML_CONFIG_CACHE.pop(next(iter(_YAML_CONFIG_CACHE)))
+                    _YAML_CONFIG_CACHE[config_hash] = serialized
+                
+                config_path.write_text(serialized)
             else:
                 with open(config_path, 'w') as f:
                     json.dump(self.config, f, indent=2, default=str)